@@ -1,4 +1,77 @@
 import math
+from operator import mul
+
+# Tabelas de blending functions por (grau, num_samples): linha k = pesos de
+# Bernstein B_{i,n}(t_k) de cada ponto de controle. Compartilhadas por todas
+# as curvas de mesmo grau e amostragem; limitadas a _MAX_TABLES entradas.
+_MAX_TABLES = 64
+_basis_tables = {}
+
+# Acima deste grau (curvas G1 com muitos pontos) binomial * potências perde
+# precisão proporcionalmente ao grau e estoura o float perto de grau 1030: as
+# linhas da tabela saem de bernstein_row
+HIGH_DEGREE = 8
+
+# peso (relativo ao maior) que não altera a soma em precisão dupla
+_NEGLIGIBLE = 2.0**-60
+
+
+# Pesos B_{i,n}(t) sem binomiais gigantes nem potências minúsculas: parte do
+# maior peso (i perto de (n + 1) * t, valendo 1) e anda para os dois lados
+# pela razão B_{i+1} / B_i = (n - i) / (i + 1) * t / (1 - t), que só encolhe a
+# partir dali, parando quando o peso fica desprezível. Normalizar pela soma
+# recupera a escala e garante a partição da unidade.
+# Devolve (i0, pesos): só os pesos relevantes, a partir do índice i0 (são
+# O(sqrt(n)) deles, então o custo por amostra cresce devagar com o grau).
+def bernstein_row(n, t):
+    if t <= 0:
+        return 0, (1.0,)
+    if t >= 1:
+        return n, (1.0,)
+    r = t / (1 - t)
+    k = min(n, int((n + 1) * t))
+    upper = []
+    w = 1.0
+    for i in range(k, n):
+        w *= (n - i) / (i + 1) * r
+        if w < _NEGLIGIBLE:
+            break
+        upper.append(w)
+    lower = []
+    w = 1.0
+    for i in range(k, 0, -1):
+        w *= i / ((n - i + 1) * r)
+        if w < _NEGLIGIBLE:
+            break
+        lower.append(w)
+    weights = lower[::-1] + [1.0] + upper
+    total = math.fsum(weights)
+    return k - len(lower), tuple(w / total for w in weights)
+
+
+# Para n > HIGH_DEGREE as linhas são pares (i0, pesos) de bernstein_row
+def bernstein_table(n, num_samples):
+    key = (n, num_samples)
+    table = _basis_tables.get(key)
+    if table is None:
+        table = []
+        if n > HIGH_DEGREE:
+            for t_i in range(num_samples + 1):
+                table.append(bernstein_row(n, t_i / num_samples))
+        else:
+            binomials = [math.comb(n, i) for i in range(n + 1)]
+            for t_i in range(num_samples + 1):
+                t = t_i / num_samples
+                table.append(
+                    tuple(
+                        binomials[i] * ((1 - t) ** (n - i)) * (t**i)
+                        for i in range(n + 1)
+                    )
+                )
+        if len(_basis_tables) >= _MAX_TABLES:
+            del _basis_tables[next(iter(_basis_tables))]  # descarta a mais antiga
+        _basis_tables[key] = table
+    return table
 
 
 def bezier_curve(points, num_samples=100):
@@ -17,19 +90,66 @@ def bezier_curve(points, num_samples=100):
     #             temp[i] = (x, y)
     #     curve.append(temp[0])
 
-    # Agora utilizando Blending Functions e a fórmula dos polinômios de Bernstein
-    for t_i in range(num_samples + 1):
-        t = t_i / num_samples
-        x, y = 0, 0
-        for i, (px, py) in enumerate(points):
-            binomial = math.comb(n, i)
-            bernstein = binomial * ((1 - t) ** (n - i)) * (t**i)
-            x += bernstein * px
-            y += bernstein * py
-        curve.append((x, y))
+    # Agora utilizando Blending Functions e a fórmula dos polinômios de Bernstein,
+    # com a matriz de pesos pré-calculada: cada amostra é um produto escalar
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    if n > HIGH_DEGREE:
+        for i0, row in bernstein_table(n, num_samples):
+            i1 = i0 + len(row)
+            curve.append((sum(map(mul, row, xs[i0:i1])), sum(map(mul, row, ys[i0:i1]))))
+        return curve
+    for row in bernstein_table(n, num_samples):
+        curve.append((sum(map(mul, row, xs)), sum(map(mul, row, ys))))
     return curve
 
 
+# matriz base da Bézier cúbica
+M_BEZIER = [
+    [-1, 3, -3, 1],
+    [3, -6, 3, 0],
+    [-3, 3, 0, 0],
+    [1, 0, 0, 0],
+]
+
+
+# Bézier cúbica usando Forward Differences: num_samples + 1 amostras de
+# t = 0 a t = 1 (a última é o próprio p3, sem erro acumulado), com três
+# somas por coordenada a cada passo
+def bezier_cubic_fd(segment, num_samples=100, skip_first=False, out=None):
+    result = [] if out is None else out
+    px = [p[0] for p in segment]
+    py = [p[1] for p in segment]
+
+    # coeficientes polinomiais C = M_bezier * P
+    Cx = [sum(M_BEZIER[r][c] * px[c] for c in range(4)) for r in range(4)]
+    Cy = [sum(M_BEZIER[r][c] * py[c] for c in range(4)) for r in range(4)]
+
+    # valores iniciais de forward differences
+    delta = 1.0 / num_samples
+    x = Cx[3]
+    y = Cy[3]
+    dx = (Cx[2] + (Cx[1] + Cx[0] * delta) * delta) * delta
+    dy = (Cy[2] + (Cy[1] + Cy[0] * delta) * delta) * delta
+    d2x = (2 * Cx[1] + 6 * Cx[0] * delta) * delta * delta
+    d2y = (2 * Cy[1] + 6 * Cy[0] * delta) * delta * delta
+    d3x = 6 * Cx[0] * delta**3
+    d3y = 6 * Cy[0] * delta**3
+
+    if not skip_first:
+        result.append((x, y))
+    for _ in range(num_samples - 1):
+        x += dx
+        y += dy
+        dx += d2x
+        dy += d2y
+        d2x += d3x
+        d2y += d3y
+        result.append((x, y))
+    result.append((px[3], py[3]))
+    return result
+
+
 def bezier_multisegment(points, num_samples=100):
     if len(points) < 4:
         return bezier_curve(points, num_samples)
@@ -39,8 +159,6 @@ def bezier_multisegment(points, num_samples=100):
         segment = points[i : i + 4]
         if len(segment) < 4:
             break
-        pts = bezier_curve(segment, num_samples)
-        if curve:
-            pts = pts[1:]
-        curve.extend(pts)
+        # segmentos seguintes começam no último ponto do anterior
+        bezier_cubic_fd(segment, num_samples, skip_first=bool(curve), out=curve)
     return curve
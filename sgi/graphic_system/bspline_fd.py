@@ -1,16 +1,17 @@
+# matriz base da B-Spline cúbica
+M_BSPLINE = [
+    [-1/6,  3/6, -3/6, 1/6],
+    [ 3/6, -6/6,  3/6,   0],
+    [-3/6,   0 ,  3/6,   0],
+    [ 1/6,  4/6,  1/6,   0],
+]
+
+
 # B-Spline cúbica usando Forward Differences
 def evaluate_bspline_fd(points, num_samples=50):
     if len(points) < 4:
         return []
 
-    # matriz base da B-Spline cúbica
-    M_bs = [
-        [-1/6,  3/6, -3/6, 1/6],
-        [ 3/6, -6/6,  3/6,   0],
-        [-3/6,   0 ,  3/6,   0],
-        [ 1/6,  4/6,  1/6,   0],
-    ]
-
     result = []
     delta = 1.0 / num_samples
 
@@ -18,9 +19,9 @@ def evaluate_bspline_fd(points, num_samples=50):
         px = [points[i + j][0] for j in range(4)]
         py = [points[i + j][1] for j in range(4)]
 
-        # coeficientes polinomiais C = M_bs * P
-        Cx = [sum(M_bs[r][c] * px[c] for c in range(4)) for r in range(4)]
-        Cy = [sum(M_bs[r][c] * py[c] for c in range(4)) for r in range(4)]
+        # coeficientes polinomiais C = M_BSPLINE * P
+        Cx = [sum(M_BSPLINE[r][c] * px[c] for c in range(4)) for r in range(4)]
+        Cy = [sum(M_BSPLINE[r][c] * py[c] for c in range(4)) for r in range(4)]
 
         # valores iniciais de forward differences
         x = Cx[3]
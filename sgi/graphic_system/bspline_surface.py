@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from .point3d import Point3D
 
@@ -191,9 +191,24 @@ def subdivide_patches(control: List[List[Point3D]]) -> List[List[List[Point3D]]]
     return patches
 
 
-# Lista de grades, para cada grade (nv+1) x (nu+1) de pontos (x,y,z) (tuplas)
-def generate_bspline_mesh(control: List[List[Point3D]], nu: int = 12, nv: int = 12):
+# Grade (nv+1) x (nu+1) de pontos (x,y,z) (tuplas) de um único retalho 4x4
+def generate_bspline_patch_grid(
+    ctrl4x4: List[List[Point3D]], nu: int = 12, nv: int = 12
+):
+    return _fd_patch_grid(ctrl4x4, nu=nu, nv=nv)
+
+
+# Lista de grades, para cada grade (nv+1) x (nu+1) de pontos (x,y,z) (tuplas).
+# densities: (nu, nv) de cada retalho (ex.: escolhidas pelo LOD); se omitido,
+# todos usam nu x nv
+def generate_bspline_mesh(
+    control: List[List[Point3D]],
+    nu: int = 12,
+    nv: int = 12,
+    densities: Optional[List[Tuple[int, int]]] = None,
+):
     grids = []
-    for patch in subdivide_patches(control):
-        grids.append(_fd_patch_grid(patch, nu=nu, nv=nv))
+    for k, patch in enumerate(subdivide_patches(control)):
+        pu, pv = densities[k] if densities else (nu, nv)
+        grids.append(generate_bspline_patch_grid(patch, nu=pu, nv=pv))
     return grids
@@ -1,3 +1,11 @@
+import math
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele os lotes usam o laço escalar
+    np = None
+
 INSIDE, LEFT, RIGHT, BOTTOM, TOP = 0, 1, 2, 4, 8
 
 
@@ -83,6 +91,99 @@ def liang_barsky(x1, y1, x2, y2, window):
     return (x1 + u1 * dx, y1 + u1 * dy, x1 + u2 * dx, y1 + u2 * dy)
 
 
+# Nicholl-Lee-Nicholl: por reflexões/troca de eixos leva P1 a uma de três
+# regiões canônicas (dentro, borda esquerda ou canto superior esquerdo) e
+# decide por produtos vetoriais contra os raios P1 -> cantos da window por
+# qual borda a reta entra e sai; só divide para calcular as interseções
+# realmente usadas.
+def nicholl_lee_nicholl(x1, y1, x2, y2, window):
+    xl, xr = window.x_min, window.x_max
+    yb, yt = window.y_min, window.y_max
+    code1 = compute_out_code(x1, y1, window)
+    code2 = compute_out_code(x2, y2, window)
+    if code1 & code2:
+        return None
+
+    # transformação para o caso canônico: troca x/y e depois espelha
+    swap = False
+    sx = sy = 1.0
+    if code1 in (TOP, BOTTOM):
+        swap = True  # borda de cima/baixo vira borda direita/esquerda
+        sx = -1.0 if code1 == TOP else 1.0
+    elif code1 & RIGHT:
+        sx = -1.0
+    if code1 & BOTTOM and code1 & (LEFT | RIGHT):
+        sy = -1.0
+    if swap:
+        x1, y1, x2, y2 = y1, x1, y2, x2
+        xl, xr, yb, yt = yb, yt, xl, xr
+    if sx < 0:
+        x1, x2, xl, xr = -x1, -x2, -xr, -xl
+    if sy < 0:
+        y1, y2, yb, yt = -y1, -y2, -yt, -yb
+
+    clipped = _nln_canonical(x1, y1, x2, y2, xl, xr, yb, yt)
+    if clipped is None:
+        return None
+
+    # desfaz a transformação
+    x1, y1, x2, y2 = clipped
+    if sx < 0:
+        x1, x2 = -x1, -x2
+    if sy < 0:
+        y1, y2 = -y1, -y2
+    if swap:
+        x1, y1, x2, y2 = y1, x1, y2, x2
+    return (x1, y1, x2, y2)
+
+
+def _nln_canonical(x1, y1, x2, y2, xl, xr, yb, yt):
+    dx = x2 - x1
+    dy = y2 - y1
+    p2_inside = xl <= x2 <= xr and yb <= y2 <= yt
+
+    # P1 dentro: só falta achar a saída
+    if xl <= x1 <= xr and yb <= y1 <= yt:
+        if p2_inside:
+            return (x1, y1, x2, y2)
+        ex = (xr if dx > 0 else xl) - x1
+        ey = (yt if dy > 0 else yb) - y1
+        if dy == 0 or (dx != 0 and abs(ex * dy) <= abs(ey * dx)):
+            return (x1, y1, x1 + ex, y1 + dy * ex / dx)
+        return (x1, y1, x1 + dx * ey / dy, y1 + ey)
+
+    # produto vetorial (canto - P1) x (P2 - P1): > 0 se P2 está à esquerda
+    # (sentido anti-horário) do raio de P1 até o canto
+    def side(cx, cy):
+        return (cx - x1) * dy - (cy - y1) * dx
+
+    if y1 <= yt:
+        # P1 na região da borda esquerda: entra sempre pela esquerda
+        if x2 < xl or side(xl, yt) > 0 or side(xl, yb) < 0:
+            return None
+        start = (xl, y1 + dy * (xl - x1) / dx)
+    else:
+        # P1 no canto superior esquerdo: entra pelo topo ou pela esquerda
+        if x2 < xl or y2 > yt:
+            return None
+        if side(xl, yt) > 0:
+            if side(xr, yt) > 0:
+                return None
+            start = (x1 + dx * (yt - y1) / dy, yt)
+        else:
+            if side(xl, yb) < 0:
+                return None
+            start = (xl, y1 + dy * (xl - x1) / dx)
+
+    if p2_inside:
+        return start + (x2, y2)
+    if y1 <= yt and side(xr, yt) > 0:
+        return start + (x1 + dx * (yt - y1) / dy, yt)  # sai pelo topo
+    if side(xr, yb) < 0:
+        return start + (x1 + dx * (yb - y1) / dy, yb)  # sai por baixo
+    return start + (xr, y1 + dy * (xr - x1) / dx)  # sai pela direita
+
+
 # Clipping de Polígonos
 def sutherland_hodgman(polygon, window):
     def inside(p, edge):
@@ -132,3 +233,691 @@ def sutherland_hodgman(polygon, window):
                 output.append(intersect(s, e, edge))
             s = e
     return output
+
+
+# Região de clipping convexa qualquer (lista de vértices). Guarda, para cada
+# aresta, a normal interna (nx, ny) e c = n . V, de forma que um ponto P está
+# do lado de dentro da aresta quando nx * Px + ny * Py - c >= 0.
+class ConvexRegion:
+    def __init__(self, vertices):
+        vertices = [(float(x), float(y)) for x, y in vertices]
+        # garante orientação anti-horária (normais para dentro)
+        area = sum(
+            x1 * y2 - x2 * y1
+            for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1])
+        )
+        if area < 0:
+            vertices.reverse()
+        self.vertices = vertices
+        self.edges = []
+        for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1]):
+            nx, ny = -(y2 - y1), x2 - x1
+            self.edges.append((nx, ny, nx * x1 + ny * y1))
+
+        xs = [v[0] for v in vertices]
+        ys = [v[1] for v in vertices]
+        self.x_min, self.x_max = min(xs), max(xs)
+        self.y_min, self.y_max = min(ys), max(ys)
+
+    def contains(self, x, y):
+        return all(nx * x + ny * y >= c for nx, ny, c in self.edges)
+
+
+# Parâmetros (u1, u2) do trecho visível de P(u) = P1 + u * (dx, dy), ou None
+def _cyrus_beck_params(x1, y1, dx, dy, edges):
+    u1, u2 = 0.0, 1.0
+    for nx, ny, c in edges:
+        num = nx * x1 + ny * y1 - c
+        den = nx * dx + ny * dy
+        if den == 0:
+            if num < 0:
+                return None
+        elif den > 0:
+            u1 = max(u1, -num / den)  # entrando
+        else:
+            u2 = min(u2, -num / den)  # saindo
+        if u1 > u2:
+            return None
+    return u1, u2
+
+
+# Clipping de Retas contra uma região convexa (Cyrus-Beck)
+def cyrus_beck(x1, y1, x2, y2, region):
+    dx = x2 - x1
+    dy = y2 - y1
+    params = _cyrus_beck_params(x1, y1, dx, dy, region.edges)
+    if params is None:
+        return None
+    u1, u2 = params
+    return (x1 + u1 * dx, y1 + u1 * dy, x1 + u2 * dx, y1 + u2 * dy)
+
+
+# Clipping de Polígonos contra uma região convexa: Sutherland-Hodgman usando
+# os semiplanos das arestas da região
+def clip_convex_polygon(polygon, region):
+    output = list(polygon)
+    for nx, ny, c in region.edges:
+        input_list = output
+        output = []
+        if not input_list:
+            break
+        s = input_list[-1]
+        ds = nx * s[0] + ny * s[1] - c
+        for e in input_list:
+            de = nx * e[0] + ny * e[1] - c
+            if de >= 0:
+                if ds < 0:
+                    t = ds / (ds - de)
+                    output.append((s[0] + t * (e[0] - s[0]), s[1] + t * (e[1] - s[1])))
+                output.append(e)
+            elif ds >= 0:
+                t = ds / (ds - de)
+                output.append((s[0] + t * (e[0] - s[0]), s[1] + t * (e[1] - s[1])))
+            s, ds = e, de
+    return output
+
+
+# Como _cyrus_beck_params, mas devolve também qual aresta da região definiu
+# cada extremo: (u1, k1, u2, k2), com k = -1 quando o extremo é o próprio
+# ponto do segmento (u1 = 0 ou u2 = 1), ou None se o segmento está fora
+def _cyrus_beck_hits(x1, y1, dx, dy, edges):
+    u1, u2 = 0.0, 1.0
+    k1 = k2 = -1
+    for k, (nx, ny, c) in enumerate(edges):
+        num = nx * x1 + ny * y1 - c
+        den = nx * dx + ny * dy
+        if den == 0:
+            if num < 0:
+                return None
+        elif den > 0:
+            u = -num / den
+            if u > u1:
+                u1, k1 = u, k
+        else:
+            u = -num / den
+            if u < u2:
+                u2, k2 = u, k
+        if u1 > u2:
+            return None
+    return u1, k1, u2, k2
+
+
+def _signed_area(points):
+    return (
+        sum(
+            x1 * y2 - x2 * y1
+            for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1])
+        )
+        / 2.0
+    )
+
+
+# Ponto dentro de um polígono qualquer (regra par-ímpar)
+def _point_in_polygon(x, y, polygon):
+    inside = False
+    for (x1, y1), (x2, y2) in zip(polygon, polygon[-1:] + polygon[:-1]):
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def _orient(ax, ay, bx, by, cx, cy):
+    v = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    return (v > 0) - (v < 0)
+
+
+def _segments_intersect(p1, p2, q1, q2):
+    o1 = _orient(*p1, *p2, *q1)
+    o2 = _orient(*p1, *p2, *q2)
+    o3 = _orient(*q1, *q2, *p1)
+    o4 = _orient(*q1, *q2, *p2)
+    if o1 != o2 and o3 != o4:
+        return True
+
+    # colineares: basta alguma sobreposição das projeções
+    def on_segment(a, b, c):
+        (ax, ay), (bx, by), (cx, cy) = a, b, c
+        return min(ax, bx) <= cx <= max(ax, bx) and min(ay, by) <= cy <= max(ay, by)
+
+    return (
+        (o1 == 0 and on_segment(p1, p2, q1))
+        or (o2 == 0 and on_segment(p1, p2, q2))
+        or (o3 == 0 and on_segment(q1, q2, p1))
+        or (o4 == 0 and on_segment(q1, q2, p2))
+    )
+
+
+# Polígono simples (sem auto-interseção)? As arestas são distribuídas numa
+# grade uniforme e só pares que dividem alguma célula são testados.
+def is_simple_polygon(polygon):
+    n = len(polygon)
+    if n < 4:
+        return n == 3
+    xs = [p[0] for p in polygon]
+    ys = [p[1] for p in polygon]
+    x0, y0 = min(xs), min(ys)
+    side = max(int(math.sqrt(n)), 1)
+    cw = (max(xs) - x0) / side or 1.0
+    ch = (max(ys) - y0) / side or 1.0
+
+    cells = {}
+    for i in range(n):
+        (ax, ay), (bx, by) = polygon[i], polygon[(i + 1) % n]
+        i0 = min(int((min(ax, bx) - x0) / cw), side - 1)
+        i1 = min(int((max(ax, bx) - x0) / cw), side - 1)
+        j0 = min(int((min(ay, by) - y0) / ch), side - 1)
+        j1 = min(int((max(ay, by) - y0) / ch), side - 1)
+        for ci in range(i0, i1 + 1):
+            for cj in range(j0, j1 + 1):
+                cells.setdefault((ci, cj), []).append(i)
+
+    tested = set()
+    for edges in cells.values():
+        for a in range(len(edges)):
+            i = edges[a]
+            for b in range(a + 1, len(edges)):
+                j = edges[b]
+                if (j - i) % n in (1, n - 1) or (i, j) in tested:
+                    continue  # arestas vizinhas compartilham um vértice
+                tested.add((i, j))
+                if _segments_intersect(
+                    polygon[i], polygon[(i + 1) % n], polygon[j], polygon[(j + 1) % n]
+                ):
+                    return False
+    return True
+
+
+# Clipping de Polígonos (Weiler-Atherton) contra uma região convexa. Ao
+# contrário de Sutherland-Hodgman, um polígono côncavo que cruza a borda
+# várias vezes vira uma lista de polígonos separados, sem arestas-ponte ao
+# longo da borda da região. O polígono deve ser simples (ver
+# is_simple_polygon). Devolve uma lista (possivelmente vazia) de polígonos.
+def weiler_atherton(polygon, region):
+    if len(polygon) < 3:
+        return []
+
+    # aceite/rejeição rápidos pela caixa envolvente, antes de olhar arestas
+    xs = [p[0] for p in polygon]
+    ys = [p[1] for p in polygon]
+    bx0, by0, bx1, by1 = min(xs), min(ys), max(xs), max(ys)
+    if (
+        bx0 > region.x_max
+        or bx1 < region.x_min
+        or by0 > region.y_max
+        or by1 < region.y_min
+    ):
+        return []
+    if all(
+        region.contains(x, y)
+        for x, y in ((bx0, by0), (bx1, by0), (bx1, by1), (bx0, by1))
+    ):
+        return [list(polygon)]
+
+    # vértice sobre a borda: o sujeito pode só encostar por fora, ou entrar e
+    # sair pelo vértice, e toques não viram cruzamentos na lista abaixo
+    edges = region.edges
+    if any(any(nx * x + ny * y == c for nx, ny, c in edges) for x, y in polygon):
+        return _clip_convex_parts(polygon, region)
+
+    # sujeito no mesmo sentido (anti-horário) da região
+    subject = [(x, y) for x, y in polygon]
+    if _signed_area(subject) < 0:
+        subject.reverse()
+    vertices = region.vertices
+    m = len(vertices)
+
+    # lista do sujeito com as interseções inseridas; cada interseção guarda
+    # sua posição no perímetro da região (aresta + fração) e se é de entrada
+    seq = []
+    crossings = {}  # índice em seq -> [posição, entrando?]
+    n = len(subject)
+    for i in range(n):
+        x1, y1 = subject[i]
+        x2, y2 = subject[(i + 1) % n]
+        seq.append((x1, y1))
+        dx, dy = x2 - x1, y2 - y1
+        hits = _cyrus_beck_hits(x1, y1, dx, dy, region.edges)
+        if hits is None or hits[0] >= hits[2]:
+            continue  # fora, ou só toca a borda
+        u1, k1, u2, k2 = hits
+        for u, k, entering in ((u1, k1, True), (u2, k2, False)):
+            if k < 0:
+                continue
+            px, py = x1 + u * dx, y1 + u * dy
+            (vx, vy), (wx, wy) = vertices[k], vertices[(k + 1) % m]
+            ex, ey = wx - vx, wy - vy
+            t = ((px - vx) * ex + (py - vy) * ey) / (ex * ex + ey * ey)
+            pos = k + min(max(t, 0.0), 1.0)
+            crossings[len(seq)] = [pos % m, entering]
+            seq.append((px, py))
+
+    if not crossings:
+        # sem cruzamentos: sujeito todo dentro, região toda dentro do sujeito,
+        # ou disjuntos (nenhum vértice está sobre a borda, então o primeiro
+        # está estritamente dentro ou fora)
+        if region.contains(*subject[0]):
+            return [subject]
+        cx = sum(v[0] for v in vertices) / m
+        cy = sum(v[1] for v in vertices) / m
+        if _point_in_polygon(cx, cy, subject):
+            return [list(vertices)]
+        return []
+
+    # ordem das interseções ao longo do perímetro (sentido anti-horário)
+    order = sorted(crossings, key=lambda j: crossings[j][0])
+    rank = {j: r for r, j in enumerate(order)}
+    entries = [j for j in order if crossings[j][1]]
+    if 2 * len(entries) != len(order):
+        return _clip_convex_parts(polygon, region)  # caso degenerado
+
+    out = []
+    visited = set()
+    limit = len(seq) + m * len(order) + 1
+    for start in entries:
+        if start in visited:
+            continue
+        poly = []
+        cur = start
+        while True:
+            visited.add(cur)
+            # segue o sujeito da entrada até a próxima saída
+            j = cur
+            poly.append(seq[j])
+            j = (j + 1) % len(seq)
+            while j not in crossings:
+                poly.append(seq[j])
+                j = (j + 1) % len(seq)
+            if crossings[j][1] or len(poly) > limit:
+                return _clip_convex_parts(polygon, region)
+            poly.append(seq[j])
+
+            # segue a borda da região da saída até a próxima entrada
+            nxt = order[(rank[j] + 1) % len(order)]
+            if not crossings[nxt][1]:
+                return _clip_convex_parts(polygon, region)
+            a, b = crossings[j][0], crossings[nxt][0]
+            ka, kb = int(a), int(b)
+            if b <= a:
+                kb += m
+            poly.extend(vertices[k % m] for k in range(ka + 1, kb + 1))
+
+            cur = nxt
+            if cur == start:
+                break
+            if cur in visited:
+                return _clip_convex_parts(polygon, region)
+        if len(poly) >= 3:
+            out.append(poly)
+    return out
+
+
+# Recurso para casos degenerados (vértices exatamente sobre a borda): um único
+# polígono via clip_convex_polygon, descartado se não tiver área (sujeito que
+# só encosta na borda)
+def _clip_convex_parts(polygon, region):
+    clipped = clip_convex_polygon(polygon, region)
+    if len(clipped) < 3 or _signed_area(clipped) == 0:
+        return []
+    return [clipped]
+
+
+# Lotes menores que isso ficam no laço escalar: converter de/para arrays
+# custa mais do que se ganha
+NUMPY_MIN_BATCH = 64
+
+
+# Clipping de retas em lote (Liang-Barsky): recebe os segmentos
+# (x1, y1, x2, y2) e devolve (recortados, aceitos), ambos alinhados com a
+# entrada. Com uma lista, segmentos rejeitados ficam como None em
+# "recortados" e False em "aceitos". Com um array NumPy (N, 4), devolve um
+# array (N, 4) e a máscara de aceitos (liang_barsky_arrays).
+def liang_barsky_batch(segments, window):
+    if np is not None:
+        if isinstance(segments, np.ndarray):
+            return liang_barsky_arrays(segments, window)
+        if len(segments) >= NUMPY_MIN_BATCH:
+            clipped, accepted = liang_barsky_arrays(segments_array(segments), window)
+            accepted = accepted.tolist()
+            # zip das colunas monta as tuplas sem um tuple() por linha
+            rows = zip(*clipped.T.tolist())
+            return [seg if ok else None for seg, ok in zip(rows, accepted)], accepted
+    return _liang_barsky_loop(segments, window)
+
+
+# Lista de segmentos (x1, y1, x2, y2) -> array (N, 4)
+def segments_array(segments):
+    flat = np.fromiter(chain.from_iterable(segments), float, 4 * len(segments))
+    return flat.reshape(-1, 4)
+
+
+# Liang-Barsky vetorizado sobre um array (N, 4). p/q das quatro bordas
+# (esquerda, direita, inferior, superior) viram arrays (4, N); u1 é o maior
+# q/p das bordas de entrada (p < 0) e u2 o menor das de saída (p > 0).
+# As linhas de segmentos rejeitados não têm significado.
+def liang_barsky_arrays(segments, window):
+    x1, y1, x2, y2 = segments.T
+    dx = x2 - x1
+    dy = y2 - y1
+    p = np.stack((-dx, dx, -dy, dy))
+    q = np.stack(
+        (x1 - window.x_min, window.x_max - x1, y1 - window.y_min, window.y_max - y1)
+    )
+
+    # paralelo a uma borda e do lado de fora dela
+    accepted = ~np.any((p == 0) & (q < 0), axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = q / p
+    u1 = np.where(p < 0, r, 0.0).max(axis=0)
+    u2 = np.where(p > 0, r, 1.0).min(axis=0)
+    accepted &= u1 <= u2
+
+    clipped = np.stack((x1 + u1 * dx, y1 + u1 * dy, x1 + u2 * dx, y1 + u2 * dy), axis=1)
+    return clipped, accepted
+
+
+# Laço escalar do lote: os limites da window são lidos uma única vez e as
+# quatro bordas são desenroladas, evitando o custo de uma chamada por segmento
+def _liang_barsky_loop(segments, window):
+    x_min, x_max = window.x_min, window.x_max
+    y_min, y_max = window.y_min, window.y_max
+    clipped = []
+    accepted = []
+
+    for x1, y1, x2, y2 in segments:
+        dx = x2 - x1
+        dy = y2 - y1
+        u1, u2 = 0.0, 1.0
+
+        # bordas esquerda (p = -dx) e direita (p = dx)
+        if dx == 0:
+            if x1 < x_min or x1 > x_max:
+                clipped.append(None)
+                accepted.append(False)
+                continue
+        elif dx > 0:
+            u1 = max(u1, (x1 - x_min) / -dx)
+            u2 = min(u2, (x_max - x1) / dx)
+        else:
+            u2 = min(u2, (x1 - x_min) / -dx)
+            u1 = max(u1, (x_max - x1) / dx)
+
+        # bordas inferior (p = -dy) e superior (p = dy)
+        if dy == 0:
+            if y1 < y_min or y1 > y_max:
+                clipped.append(None)
+                accepted.append(False)
+                continue
+        elif dy > 0:
+            u1 = max(u1, (y1 - y_min) / -dy)
+            u2 = min(u2, (y_max - y1) / dy)
+        else:
+            u2 = min(u2, (y1 - y_min) / -dy)
+            u1 = max(u1, (y_max - y1) / dy)
+
+        if u1 > u2:
+            clipped.append(None)
+            accepted.append(False)
+        else:
+            clipped.append((x1 + u1 * dx, y1 + u1 * dy, x1 + u2 * dx, y1 + u2 * dy))
+            accepted.append(True)
+
+    return clipped, accepted
+
+
+# Algoritmos escalares de clipping de retas por modo. No modo "CB"
+# (Cyrus-Beck) a "window" é uma ConvexRegion.
+LINE_CLIPPERS = {
+    "CS": cohen_sutherland,
+    "LB": liang_barsky,
+    "NLN": nicholl_lee_nicholl,
+    "CB": cyrus_beck,
+}
+
+
+# Clipping em lote conforme o modo: "LB" usa o motor em lote; os demais caem
+# no algoritmo escalar, um segmento por vez
+def clip_segments(segments, window, mode="LB"):
+    if mode == "LB":
+        return liang_barsky_batch(segments, window)
+    clipper = LINE_CLIPPERS.get(mode, cohen_sutherland)
+    clipped = [clipper(x1, y1, x2, y2, window) for x1, y1, x2, y2 in segments]
+    return clipped, [c is not None for c in clipped]
+
+
+# Clipping de polilinhas: percorre a polilinha inteira (lista de pontos) e
+# devolve os trechos visíveis máximos, cada um uma lista de pontos, para que
+# cada trecho vire uma única linha no canvas. Vértices que não foram
+# recortados são devolvidos exatamente como vieram. No modo "CB" a "window"
+# é uma ConvexRegion.
+def clip_polyline(points, window, mode="LB"):
+    clipper = LINE_CLIPPERS.get(mode, cohen_sutherland)
+    x_min, x_max = window.x_min, window.x_max
+    y_min, y_max = window.y_min, window.y_max
+    runs = []
+    run = None
+
+    for i in range(len(points) - 1):
+        x1, y1 = points[i]
+        x2, y2 = points[i + 1]
+
+        if mode == "LB":
+            dx = x2 - x1
+            dy = y2 - y1
+            u1, u2 = 0.0, 1.0
+            if dx == 0:
+                if x1 < x_min or x1 > x_max:
+                    run = None
+                    continue
+            elif dx > 0:
+                u1 = max(u1, (x1 - x_min) / -dx)
+                u2 = min(u2, (x_max - x1) / dx)
+            else:
+                u2 = min(u2, (x1 - x_min) / -dx)
+                u1 = max(u1, (x_max - x1) / dx)
+            if dy == 0:
+                if y1 < y_min or y1 > y_max:
+                    run = None
+                    continue
+            elif dy > 0:
+                u1 = max(u1, (y1 - y_min) / -dy)
+                u2 = min(u2, (y_max - y1) / dy)
+            else:
+                u2 = min(u2, (y1 - y_min) / -dy)
+                u1 = max(u1, (y_max - y1) / dy)
+            if u1 > u2:
+                run = None
+                continue
+            start = (x1, y1) if u1 == 0.0 else (x1 + u1 * dx, y1 + u1 * dy)
+            end = (x2, y2) if u2 == 1.0 else (x1 + u2 * dx, y1 + u2 * dy)
+            start_clipped = u1 != 0.0
+            end_clipped = u2 != 1.0
+        elif mode == "CB":
+            dx = x2 - x1
+            dy = y2 - y1
+            params = _cyrus_beck_params(x1, y1, dx, dy, window.edges)
+            if params is None:
+                run = None
+                continue
+            u1, u2 = params
+            start = (x1, y1) if u1 == 0.0 else (x1 + u1 * dx, y1 + u1 * dy)
+            end = (x2, y2) if u2 == 1.0 else (x1 + u2 * dx, y1 + u2 * dy)
+            start_clipped = u1 != 0.0
+            end_clipped = u2 != 1.0
+        else:
+            clipped = clipper(x1, y1, x2, y2, window)
+            if clipped is None:
+                run = None
+                continue
+            start = clipped[0], clipped[1]
+            end = clipped[2], clipped[3]
+            start_clipped = start != (x1, y1)
+            end_clipped = end != (x2, y2)
+
+        # o trecho só continua se o segmento anterior saiu intacto pelo mesmo
+        # vértice por onde este entra
+        if run is None or start_clipped:
+            run = [start]
+            runs.append(run)
+        run.append(end)
+        if end_clipped:
+            run = None
+
+    return runs
+
+
+# Classificação de uma caixa envolvente contra a window
+INSIDE_BOX, OUTSIDE_BOX, PARTIAL_BOX = "inside", "outside", "partial"
+
+
+# Contexto de clipping de um quadro: guarda os limites alinhados da window e,
+# se ela estiver rotacionada, a região convexa equivalente no mundo (com as
+# normais das arestas já calculadas), tudo feito uma única vez. Janelas
+# rotacionadas (ou uma região convexa qualquer passada em "region") são
+# recortadas direto no mundo por Cyrus-Beck, sem levar cada ponto para o
+# espaço da janela e de volta. Tem x_min/x_max/y_min/y_max, então pode ser
+# passado diretamente como "window" para os algoritmos acima.
+class ClipContext:
+    def __init__(
+        self, x_min, y_min, x_max, y_max, angle_deg=0.0, mode="LB", region=None
+    ):
+        self.x_min, self.x_max = x_min, x_max
+        self.y_min, self.y_max = y_min, y_max
+        self.mode = mode
+        # contagens amostradas [dentro, fora, cruzando] dos segmentos que
+        # passaram pelo clipping; None desliga a coleta (usada pelo modo "AUTO")
+        self.stats = None
+
+        if region is None and abs(angle_deg) > 1e-9:
+            # cantos da window girados por -ângulo em torno do centro
+            cx = (x_min + x_max) / 2.0
+            cy = (y_min + y_max) / 2.0
+            a = math.radians(-angle_deg)
+            ca, sa = math.cos(a), math.sin(a)
+            region = [
+                ((x - cx) * ca - (y - cy) * sa + cx, (x - cx) * sa + (y - cy) * ca + cy)
+                for x, y in (
+                    (x_min, y_min),
+                    (x_max, y_min),
+                    (x_max, y_max),
+                    (x_min, y_max),
+                )
+            ]
+        self.region = None if region is None else ConvexRegion(region)
+        self._window_region = None  # window como ConvexRegion (Weiler-Atherton)
+
+        # caixa alinhada aos eixos do mundo que contém a área visível
+        if self.region is None:
+            self.world_bbox = (x_min, y_min, x_max, y_max)
+        else:
+            r = self.region
+            self.world_bbox = (r.x_min, r.y_min, r.x_max, r.y_max)
+
+    @classmethod
+    def from_window(cls, window, mode="LB"):
+        return cls(
+            window.x_min,
+            window.y_min,
+            window.x_max,
+            window.y_max,
+            window.rotation_angle,
+            mode,
+        )
+
+    # INSIDE_BOX, OUTSIDE_BOX ou PARTIAL_BOX para uma caixa do mundo
+    def bbox_state(self, bbox):
+        if bbox is None:
+            return OUTSIDE_BOX
+        bx0, by0, bx1, by1 = bbox
+        wx0, wy0, wx1, wy1 = self.world_bbox
+        if bx0 > wx1 or bx1 < wx0 or by0 > wy1 or by1 < wy0:
+            return OUTSIDE_BOX
+        if self.region is None:
+            if wx0 <= bx0 and bx1 <= wx1 and wy0 <= by0 and by1 <= wy1:
+                return INSIDE_BOX
+            return PARTIAL_BOX
+
+        # região convexa: fora se os quatro cantos estão do lado de fora de
+        # alguma aresta; dentro se estão do lado de dentro de todas
+        corners = ((bx0, by0), (bx1, by0), (bx1, by1), (bx0, by1))
+        inside = True
+        for nx, ny, c in self.region.edges:
+            n_in = sum(1 for x, y in corners if nx * x + ny * y >= c)
+            if n_in == 0:
+                return OUTSIDE_BOX
+            if n_in < 4:
+                inside = False
+        return INSIDE_BOX if inside else PARTIAL_BOX
+
+    # Ponto do mundo dentro da área visível? Devolve o próprio ponto ou None
+    def clip_point(self, x, y):
+        if self.region is None:
+            return clip_point(x, y, self)
+        return (x, y) if self.region.contains(x, y) else None
+
+    # Reta do mundo recortada (x1, y1, x2, y2) ou None
+    def clip_line(self, x1, y1, x2, y2):
+        if self.region is not None:
+            return cyrus_beck(x1, y1, x2, y2, self.region)
+        return LINE_CLIPPERS.get(self.mode, liang_barsky)(x1, y1, x2, y2, self)
+
+    # Classifica pelos códigos de região uma amostra de segmentos
+    # ((x1, y1), (x2, y2)) e acumula em self.stats
+    def _record(self, samples):
+        stats = self.stats
+        for (x1, y1), (x2, y2) in samples:
+            code1 = compute_out_code(x1, y1, self)
+            code2 = compute_out_code(x2, y2, self)
+            if not (code1 | code2):
+                stats[0] += 1
+            elif code1 & code2:
+                stats[1] += 1
+            else:
+                stats[2] += 1
+
+    # Segmentos (x1, y1, x2, y2) do mundo em lote; devolve só os aceitos
+    def clip_segments(self, segments):
+        if self.stats is not None and self.region is None:
+            # amostra de até ~32 segmentos por chamada
+            stride = max(1, len(segments) // 32)
+            self._record(((s[0], s[1]), (s[2], s[3])) for s in segments[::stride])
+        if self.region is not None:
+            clipped, _accepted = clip_segments(segments, self.region, "CB")
+        elif self.mode == "LB" and np is not None and len(segments) >= NUMPY_MIN_BATCH:
+            clipped, accepted = liang_barsky_arrays(segments_array(segments), self)
+            return list(zip(*clipped[accepted].T.tolist()))
+        else:
+            clipped, _accepted = clip_segments(segments, self, self.mode)
+        return [seg for seg in clipped if seg is not None]
+
+    # Trechos visíveis (listas de pontos do mundo) de uma polilinha
+    def clip_polyline(self, points):
+        if self.stats is not None and self.region is None:
+            stride = max(1, len(points) // 32)
+            self._record(zip(points[::stride], points[1::stride]))
+        if self.region is not None:
+            return clip_polyline(points, self.region, "CB")
+        return clip_polyline(points, self, self.mode)
+
+    # Polígono do mundo recortado em pedaços separados (Weiler-Atherton)
+    def clip_polygon_parts(self, points):
+        region = self.region
+        if region is None:
+            region = self._window_region
+            if region is None:
+                region = self._window_region = ConvexRegion(
+                    [
+                        (self.x_min, self.y_min),
+                        (self.x_max, self.y_min),
+                        (self.x_max, self.y_max),
+                        (self.x_min, self.y_max),
+                    ]
+                )
+        return weiler_atherton(points, region)
+
+    # Polígono do mundo recortado (lista de pontos, possivelmente vazia)
+    def clip_polygon(self, points):
+        if not points:
+            return []
+        if self.region is not None:
+            return clip_convex_polygon(points, self.region)
+        return sutherland_hodgman(points, self) or []
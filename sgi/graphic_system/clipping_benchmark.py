@@ -0,0 +1,304 @@
+import math
+import random
+import time
+
+from .clipping import (
+    ConvexRegion,
+    clip_convex_polygon,
+    clip_segments,
+    cohen_sutherland,
+    liang_barsky,
+    liang_barsky_arrays,
+    nicholl_lee_nicholl,
+    np,
+    segments_array,
+    sutherland_hodgman,
+    weiler_atherton,
+)
+
+# Benchmark dos algoritmos de clipping sobre cargas sintéticas.
+#
+# Uso (a partir de sgi/):  python -m graphic_system.clipping_benchmark
+#
+# Cada carga tem uma proporção de elementos inteiramente dentro, inteiramente
+# fora e cruzando a borda da window, e uma rotação da window. A vazão é medida
+# em elementos (segmentos ou polígonos) por segundo. Com NumPy instalado,
+# "LB-batch" inclui a conversão lista <-> array e "LB-array" mede só o
+# Liang-Barsky vetorizado sobre um array já montado.
+
+# Proporções (dentro, fora, cruzando) das cargas padrão
+DEFAULT_RATIOS = [
+    (0.9, 0.05, 0.05),
+    (0.05, 0.9, 0.05),
+    (0.05, 0.05, 0.9),
+    (0.34, 0.33, 0.33),
+]
+DEFAULT_ROTATIONS = [0.0, 30.0]
+
+# Algoritmos escalares de reta medidos individualmente
+SEGMENT_ALGORITHMS = {
+    "CS": cohen_sutherland,
+    "LB": liang_barsky,
+    "NLN": nicholl_lee_nicholl,
+}
+
+
+class _Window:
+    def __init__(self, x_min=-100.0, x_max=100.0, y_min=-100.0, y_max=100.0):
+        self.x_min, self.x_max = x_min, x_max
+        self.y_min, self.y_max = y_min, y_max
+        self.rotation_angle = 0.0
+
+
+def _inside_point(rnd, window):
+    return (
+        rnd.uniform(window.x_min, window.x_max),
+        rnd.uniform(window.y_min, window.y_max),
+    )
+
+
+# Pontos fora da window, todos na faixa (de até uma window de largura) além
+# de um mesmo lado sorteado
+def _outside_points(rnd, window, count):
+    w = window.x_max - window.x_min
+    h = window.y_max - window.y_min
+    cx = (window.x_min + window.x_max) / 2.0
+    cy = (window.y_min + window.y_max) / 2.0
+    side = rnd.choice("LRBT")
+    points = []
+    for _ in range(count):
+        d = rnd.uniform(0.01, 1)
+        if side == "L":
+            points.append((window.x_min - d * w, cy + rnd.uniform(-h, h)))
+        elif side == "R":
+            points.append((window.x_max + d * w, cy + rnd.uniform(-h, h)))
+        elif side == "B":
+            points.append((cx + rnd.uniform(-w, w), window.y_min - d * h))
+        else:
+            points.append((cx + rnd.uniform(-w, w), window.y_max + d * h))
+    return points
+
+
+# Gira pontos em torno do centro da window: +ângulo leva do mundo para o
+# espaço da window, -ângulo faz o caminho inverso
+def _rotate(points, window, angle_deg):
+    if abs(angle_deg) <= 1e-9:
+        return points
+    cx = (window.x_min + window.x_max) / 2.0
+    cy = (window.y_min + window.y_max) / 2.0
+    a = math.radians(angle_deg)
+    ca, sa = math.cos(a), math.sin(a)
+    return [
+        ((x - cx) * ca - (y - cy) * sa + cx, (x - cx) * sa + (y - cy) * ca + cy)
+        for x, y in points
+    ]
+
+
+def _region(window, rotation):
+    corners = [
+        (window.x_min, window.y_min),
+        (window.x_max, window.y_min),
+        (window.x_max, window.y_max),
+        (window.x_min, window.y_max),
+    ]
+    return ConvexRegion(_rotate(corners, window, -rotation))
+
+
+def _classes(n, ratios, rnd):
+    inside, outside, _straddle = ratios
+    out = []
+    for _ in range(n):
+        r = rnd.random()
+        out.append(
+            "inside"
+            if r < inside
+            else "outside" if r < inside + outside else "straddle"
+        )
+    return out
+
+
+# Segmentos (x1, y1, x2, y2) do mundo com as proporções pedidas
+def make_segment_workload(n, ratios, window, rotation=0.0, seed=0):
+    rnd = random.Random(seed)
+    segments = []
+    for kind in _classes(n, ratios, rnd):
+        if kind == "inside":
+            p1, p2 = _inside_point(rnd, window), _inside_point(rnd, window)
+        elif kind == "straddle":
+            p1, p2 = _inside_point(rnd, window), _outside_points(rnd, window, 1)[0]
+        else:
+            p1, p2 = _outside_points(rnd, window, 2)
+        p1, p2 = _rotate([p1, p2], window, -rotation)
+        segments.append(p1 + p2)
+    return segments
+
+
+# Polígonos (estrelas irregulares, côncavas) com as proporções pedidas
+def make_polygon_workload(n, ratios, window, rotation=0.0, seed=0, vertices=12):
+    rnd = random.Random(seed)
+    w = window.x_max - window.x_min
+    polygons = []
+    for kind in _classes(n, ratios, rnd):
+        radius = rnd.uniform(0.05, 0.2) * w
+        if kind == "inside":
+            cx = rnd.uniform(window.x_min + radius, window.x_max - radius)
+            cy = rnd.uniform(window.y_min + radius, window.y_max - radius)
+        elif kind == "outside":
+            cx = window.x_max + radius + rnd.uniform(0, w)
+            cy = rnd.uniform(window.y_min, window.y_max)
+        else:
+            cx = rnd.choice([window.x_min, window.x_max])
+            cy = rnd.uniform(window.y_min, window.y_max)
+        poly = []
+        for i in range(vertices):
+            a = 2 * math.pi * i / vertices
+            r = radius * (1.0 if i % 2 == 0 else rnd.uniform(0.3, 0.8))
+            poly.append((cx + r * math.cos(a), cy + r * math.sin(a)))
+        polygons.append(_rotate(poly, window, -rotation))
+    return polygons
+
+
+def _timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+# Mede cada algoritmo de reta sobre os segmentos. Em window rotacionada, os
+# algoritmos alinhados aos eixos incluem o custo de levar os pontos para o
+# espaço da window; "CB" recorta direto no mundo.
+def bench_segments(segments, window, rotation=0.0, repeat=3):
+    region = _region(window, rotation)
+
+    def local():
+        if abs(rotation) <= 1e-9:
+            return segments
+        points = _rotate(
+            [p for x1, y1, x2, y2 in segments for p in ((x1, y1), (x2, y2))],
+            window,
+            rotation,
+        )
+        return [points[i] + points[i + 1] for i in range(0, len(points), 2)]
+
+    runs = {}
+    for name, clipper in SEGMENT_ALGORITHMS.items():
+        runs[name] = lambda clipper=clipper: [
+            clipper(x1, y1, x2, y2, window) for x1, y1, x2, y2 in local()
+        ]
+    runs["LB-batch"] = lambda: clip_segments(local(), window, "LB")
+    if np is not None:
+        array = segments_array(local())
+        runs["LB-array"] = lambda: liang_barsky_arrays(array, window)
+    runs["CB"] = lambda: clip_segments(segments, region, "CB")
+
+    n = len(segments)
+    return {name: n / max(_timed(run, repeat), 1e-12) for name, run in runs.items()}
+
+
+# Mede os algoritmos de polígono sobre os polígonos (mesma convenção de
+# rotação de bench_segments)
+def bench_polygons(polygons, window, rotation=0.0, repeat=3):
+    region = _region(window, rotation)
+    runs = {
+        "SH": lambda: [
+            sutherland_hodgman(_rotate(p, window, rotation), window) for p in polygons
+        ],
+        "CB": lambda: [clip_convex_polygon(p, region) for p in polygons],
+        "WA": lambda: [weiler_atherton(p, region) for p in polygons],
+    }
+    n = len(polygons)
+    return {name: n / max(_timed(run, repeat), 1e-12) for name, run in runs.items()}
+
+
+# Roda todas as cargas e devolve linhas (carga, rotação, tipo, algoritmo, vazão)
+def run_benchmark(
+    n_segments=20000,
+    n_polygons=2000,
+    ratios=DEFAULT_RATIOS,
+    rotations=DEFAULT_ROTATIONS,
+    repeat=3,
+    seed=0,
+):
+    window = _Window()
+    rows = []
+    for rotation in rotations:
+        for ratio in ratios:
+            segments = make_segment_workload(n_segments, ratio, window, rotation, seed)
+            for name, rate in bench_segments(
+                segments, window, rotation, repeat
+            ).items():
+                rows.append((ratio, rotation, "segmentos", name, rate))
+            polygons = make_polygon_workload(n_polygons, ratio, window, rotation, seed)
+            for name, rate in bench_polygons(
+                polygons, window, rotation, repeat
+            ).items():
+                rows.append((ratio, rotation, "polígonos", name, rate))
+    return rows
+
+
+def format_report(rows):
+    lines = [
+        f"{'dentro/fora/cruza':>18} {'rot':>5} {'tipo':>10} {'algoritmo':>9} {'elem/s':>12}"
+    ]
+    for (inside, outside, straddle), rotation, kind, name, rate in rows:
+        ratio = f"{inside:.2f}/{outside:.2f}/{straddle:.2f}"
+        lines.append(f"{ratio:>18} {rotation:5.0f} {kind:>10} {name:>9} {rate:12.0f}")
+    return "\n".join(lines)
+
+
+# Seleção automática (modo "AUTO" do GraphicSystem)
+#
+# Uma calibração rápida mede, uma única vez por processo, a vazão em lote de
+# cada algoritmo de reta em três cargas puras (tudo dentro, tudo fora, tudo
+# cruzando). O tempo por segmento de um quadro é estimado como a mistura
+# dessas cargas nas proporções observadas, e vence o algoritmo mais rápido.
+AUTO_CANDIDATES = ("CS", "LB", "NLN")
+_PURE_RATIOS = {
+    "inside": (1.0, 0.0, 0.0),
+    "outside": (0.0, 1.0, 0.0),
+    "straddle": (0.0, 0.0, 1.0),
+}
+_calibration = None
+
+
+def calibrate(n_segments=2000, repeat=2, seed=0):
+    global _calibration
+    if _calibration is None:
+        window = _Window()
+        table = {}
+        for kind, ratio in _PURE_RATIOS.items():
+            segments = make_segment_workload(n_segments, ratio, window, 0.0, seed)
+            table[kind] = {
+                mode: n_segments
+                / max(
+                    _timed(lambda m=mode: clip_segments(segments, window, m), repeat),
+                    1e-12,
+                )
+                for mode in AUTO_CANDIDATES
+            }
+        _calibration = table
+    return _calibration
+
+
+# Algoritmo mais rápido para as contagens (dentro, fora, cruzando) observadas
+def choose_line_clipper(inside, outside, straddle):
+    total = inside + outside + straddle
+    if total <= 0:
+        return "LB"
+    table = calibrate()
+    weights = {
+        "inside": inside / total,
+        "outside": outside / total,
+        "straddle": straddle / total,
+    }
+    return min(
+        AUTO_CANDIDATES,
+        key=lambda mode: sum(w / table[kind][mode] for kind, w in weights.items()),
+    )
+
+
+if __name__ == "__main__":
+    print(format_report(run_benchmark()))
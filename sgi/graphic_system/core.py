@@ -1,11 +1,20 @@
 import math
+import time
 import tkinter as tk
 from tkinter import colorchooser, filedialog, messagebox, simpledialog
 
 from .bezier_curve import bezier_curve, bezier_multisegment
-from .bezier_surface import generate_surface_grid
 from .bspline_fd import evaluate_bspline_fd
-from .clipping import clip_point, cohen_sutherland, liang_barsky, sutherland_hodgman
+from .clipping import (
+    INSIDE_BOX,
+    OUTSIDE_BOX,
+    PARTIAL_BOX,
+    ClipContext,
+    is_simple_polygon,
+)
+from .clipping_benchmark import choose_line_clipper
+from .curve_batch import CURVE_SAMPLES, VECTORIZED, tessellate_batch
+from .curve_flatten import flatten_curve
 from .descriptor_obj import DescritorOBJ 
 from .objects import (
     CURVE,
@@ -19,6 +28,10 @@ from .objects import (
     options_label,
 )
 from .point3d import Point3D
+from .renderer import RetainedRenderer
+from .surface_cache import SurfaceMeshCache, fixed_densities, surface_version
+from .surface_lod import LOD_PIXELS, patch_densities, surface_patch_lengths
+from .tessellation_cache import TessellationCache, pack_points, unpack_points
 from .transform import (
     apply_transform,
     make_rotation,
@@ -27,6 +40,18 @@ from .transform import (
 )
 from .window3d import Window3D
 
+# Classificação de uma caixa envolvente contra a window
+INSIDE, OUTSIDE, PARTIAL = INSIDE_BOX, OUTSIDE_BOX, PARTIAL_BOX
+
+
+# Caixa envolvente (x_min, y_min, x_max, y_max) de uma lista de pontos 2D
+def _bbox_of(points):
+    if not points:
+        return None
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
 
 class Window:
     def __init__(self, x_min=-100, x_max=100, y_min=-100, y_max=100):
@@ -35,6 +60,11 @@ class Window:
         self.y_min = y_min
         self.y_max = y_max
         self.rotation_angle = 0.0
+        self.version = 0  # incrementado a cada mudança (pan/zoom/rotação)
+
+    # Marca a window como alterada
+    def touch(self):
+        self.version += 1
 
     def width(self):
         return self.x_max - self.x_min
@@ -49,15 +79,18 @@ class Window:
         h = self.height() * factor / 2
         self.x_min, self.x_max = cx - w, cx + w
         self.y_min, self.y_max = cy - h, cy + h
+        self.touch()
 
     def pan(self, dx, dy):
         self.x_min += dx
         self.x_max += dx
         self.y_min += dy
         self.y_max += dy
+        self.touch()
 
     def rotate(self, angle_deg):
         self.rotation_angle = (self.rotation_angle + angle_deg) % 360
+        self.touch()
 
 
 class Viewport:
@@ -69,14 +102,20 @@ class Viewport:
         self.py0 = 10
         self.px1 = 0  # será calculado
         self.py1 = 0  # será calculado
+        self.version = 0  # incrementado quando o retângulo muda
+        self._matrix = None
+        self._matrix_key = None
 
     def update_rect(self):
         w = max(self.canvas.winfo_width(), 1)
         h = max(self.canvas.winfo_height(), 1)
 
         # retângulo FIXO da viewport (margens em px)
-        self.px1 = max(w - 20, self.px0 + 1)
-        self.py1 = max(h - 20, self.py0 + 1)
+        px1 = max(w - 20, self.px0 + 1)
+        py1 = max(h - 20, self.py0 + 1)
+        if (px1, py1) != (self.px1, self.py1):
+            self.px1, self.py1 = px1, py1
+            self.version += 1
 
         vx = max(self.px1 - self.px0, 1)
         vy = max(self.py1 - self.py0, 1)
@@ -100,12 +139,14 @@ class Viewport:
             dh = (new_wy - wy) / 2.0
             self.window.y_min = cy - (wy / 2.0) - dh
             self.window.y_max = cy + (wy / 2.0) + dh
+            self.window.touch()
         else:
             # window está "mais alta" -> aumentar largura (wx)
             new_wx = wy * target_aspect
             dw = (new_wx - wx) / 2.0
             self.window.x_min = cx - (wx / 2.0) - dw
             self.window.x_max = cx + (wx / 2.0) + dw
+            self.window.touch()
 
     def _scale_and_offsets(self):
         vx = max(self.px1 - self.px0, 1)
@@ -119,40 +160,87 @@ class Viewport:
         offset_y = self.py0 + (vy - s * wy) / 2
         return s, offset_x, offset_y
 
+    # Matriz afim 2x3 (rotação da window + window->normalizado + escala e
+    # offset da viewport) compostas numa só; refeita só quando a window ou o
+    # retângulo da viewport mudam:
+    #   px = a*x + b*y + c
+    #   py = d*x + e*y + f
+    def matrix(self):
+        key = (self.window.version, self.version)
+        if self._matrix_key != key:
+            w = self.window
+            cx = (w.x_min + w.x_max) / 2
+            cy = (w.y_min + w.y_max) / 2
+            ang = math.radians(w.rotation_angle)
+            cosA, sinA = math.cos(ang), math.sin(ang)
+            s, ox, oy = self._scale_and_offsets()
+            self._matrix = (
+                s * cosA,
+                -s * sinA,
+                s * (cx - w.x_min - cosA * cx + sinA * cy) + ox,
+                -s * sinA,
+                -s * cosA,
+                s * (w.y_max - cy + sinA * cx + cosA * cy) + oy,
+            )
+            self._matrix_key = key
+        return self._matrix
+
+    # Tamanho de um pixel em unidades do mundo
+    def world_per_pixel(self):
+        return 1.0 / self._scale_and_offsets()[0]
+
     def world_to_viewport(self, x, y):
-        # aplica rotação da janela
-        cx = (self.window.x_min + self.window.x_max) / 2
-        cy = (self.window.y_min + self.window.y_max) / 2
-        ang = math.radians(self.window.rotation_angle)
-        cosA, sinA = math.cos(ang), math.sin(ang)
-        x_rel, y_rel = x - cx, y - cy
-        xw = x_rel * cosA - y_rel * sinA + cx
-        yw = x_rel * sinA + y_rel * cosA + cy
-
-        s, ox, oy = self._scale_and_offsets()
-        px = (xw - self.window.x_min) * s + ox
-        py = (self.window.y_max - yw) * s + oy
-        return px, py
+        a, b, c, d, e, f = self.matrix()
+        return a * x + b * y + c, d * x + e * y + f
+
+    # Versão em lote: converte uma lista de pontos de uma vez
+    def world_to_viewport_many(self, points):
+        a, b, c, d, e, f = self.matrix()
+        return [(a * x + b * y + c, d * x + e * y + f) for x, y in points]
+
+    # Como world_to_viewport_many, mas já no formato plano do canvas.coords
+    def world_to_viewport_flat(self, points):
+        a, b, c, d, e, f = self.matrix()
+        flat = []
+        for x, y in points:
+            flat.append(a * x + b * y + c)
+            flat.append(d * x + e * y + f)
+        return flat
 
     def viewport_to_world(self, px, py):
-        s, ox, oy = self._scale_and_offsets()
-        xw = (px - ox) / s + self.window.x_min
-        yw = self.window.y_max - (py - oy) / s
-
-        # desfaz a rotação
-        cx = (self.window.x_min + self.window.x_max) / 2
-        cy = (self.window.y_min + self.window.y_max) / 2
-        ang = -math.radians(self.window.rotation_angle)
-        cosA, sinA = math.cos(ang), math.sin(ang)
-        x_rel, y_rel = xw - cx, yw - cy
-        x = x_rel * cosA - y_rel * sinA + cx
-        y = x_rel * sinA + y_rel * cosA + cy
-        return x, y
-
-    # linha para visualizar o clipping
-    def draw_frame(self, color="red"):
-        self.canvas.create_rectangle(
-            self.px0, self.py0, self.px1, self.py1, outline=color, width=2
+        # inversa da matriz composta (desfaz escala, offset e rotação)
+        a, b, c, d, e, f = self.matrix()
+        det = a * e - b * d
+        qx, qy = px - c, py - f
+        return (e * qx - b * qy) / det, (a * qy - d * qx) / det
+
+    # linha para visualizar o clipping. mask: cor de fundo usada para cobrir
+    # tudo que for desenhado fora da moldura (modo guard-band); None = sem máscara
+    def draw_frame(self, renderer, color="red", mask=None):
+        if mask is not None:
+            w = max(self.canvas.winfo_width(), 1)
+            h = max(self.canvas.winfo_height(), 1)
+            opts = {"fill": mask, "outline": ""}
+            renderer.draw(
+                "frame_mask",
+                [
+                    ("rectangle", (0, 0, w, self.py0), opts),
+                    ("rectangle", (0, self.py1, w, h), opts),
+                    ("rectangle", (0, self.py0, self.px0, self.py1), opts),
+                    ("rectangle", (self.px1, self.py0, w, self.py1), opts),
+                ],
+                group="overlay",
+            )
+        renderer.draw(
+            "frame",
+            [
+                (
+                    "rectangle",
+                    (self.px0, self.py0, self.px1, self.py1),
+                    {"outline": color, "width": 2},
+                )
+            ],
+            group="overlay",
         )
 
 
@@ -164,27 +252,70 @@ class GraphicSystem:
         self.display = DisplayFile()
         self.window = Window()
         self.viewport = Viewport(self.canvas, self.window)
+        self.renderer = RetainedRenderer(self.canvas)
+        # objeto -> (vista, conteúdo) usados para gerar suas primitivas
+        self._drawn_keys = {}
+        self._frame_view = None  # vista do último quadro desenhado
+        # estágio -> {objeto: (chave das entradas, resultado)}
+        self._stage_cache = {}
+        self._purged_version = None
+        # amostras de curvas: LRU limitado, várias densidades por curva
+        self.tessellation_cache = TessellationCache()
+        # malhas 3D (mundo) das superfícies, por retalho
+        self.mesh_cache = SurfaceMeshCache()
+        self._clip_ctx = None  # contexto de clipping da vista corrente
+        self._auto_clip_mode = "LB"  # algoritmo escolhido pelo modo "AUTO"
+        # (dentro, fora, cruzando) das retas desde o último quadro, modo "AUTO";
+        # fica aqui e não no contexto, que é refeito a cada mudança de vista
+        self._clip_stats = [0, 0, 0]
+        # guard-band: margem (px) em volta da viewport dentro da qual nada é
+        # recortado; a máscara de draw_frame esconde essa faixa. 0 = desligado
+        self.guard_band = 0
+        # tolerância (px) do achatamento adaptativo das curvas; None = amostras
+        # fixas por segmento (CURVE_SAMPLES)
+        self.curve_tolerance = 0.25
+        # LOD das superfícies: pixels por segmento da malha; None = nu/nv fixos
+        self.surface_lod_pixels = LOD_PIXELS
+        # modo interativo: durante drag/zoom/rotação 3D os quadros saem com
+        # curvas e malhas grosseiras e sem preenchimento; depois de
+        # interactive_delay_ms sem entrada, um quadro de qualidade total.
+        # None ou 0 = sempre qualidade total
+        self.interactive_delay_ms = 250
+        self.interactive_curve_tolerance = 2.0
+        self.interactive_lod_pixels = 32.0
+        self._interactive = False
+        self._refine_job = None
         self.canvas.update_idletasks()  # mede o tamanho real do canvas
         self.viewport.update_rect()  # calcula (px0,py0)-(px1,py1)
-        self.canvas.after(0, lambda: (self.viewport.update_rect(), self.redraw()))
+
+        # agendador de quadros: eventos em rajada (drag, scroll, teclas,
+        # resize) só acumulam pan/zoom e marcam a vista como suja; um único
+        # redraw roda por tick (after_idle), limitado a max_fps
+        self.max_fps = 60  # None ou 0 = sem limite
+        self._frame_job = None
+        self._last_frame_time = 0.0
+        self._pending_pan = (0.0, 0.0)
+        self._pending_zoom = 1.0
+        self._pending_resize = False
+        self._view_dirty = False
+        self.request_redraw(resize=True)
 
         self.current_points = []  # pontos coletados via clique
         self.current_type = POINT
         self.object_count = 0
         self.default_color = "#000000"
 
-        self.clipping_mode = "CS"  # ou "LB"
+        self.clipping_mode = "CS"  # ou "LB" / "NLN" / "AUTO"
         self.curve_mode = "G0"  # ou "G1"
 
         # variáveis para UI
         self.clip_var = tk.StringVar(value="CS")
         self.fill_var = tk.BooleanVar(value=False)
+        self.guard_band_var = tk.BooleanVar(value=False)
         self.curve_mode_var = tk.StringVar(value="G0")
 
         # redesenhar ao redimensionar
-        self.canvas.bind(
-            "<Configure>", lambda e: (self.viewport.update_rect(), self.redraw())
-        )
+        self.canvas.bind("<Configure>", lambda e: self.request_redraw(resize=True))
         # capturar cliques do mouse
         self.canvas.bind("<Button-1>", self.on_click)
 
@@ -210,6 +341,7 @@ class GraphicSystem:
     def rotate_3d(
         self, yaw_deg: float = 0.0, pitch_deg: float = 0.0, roll_deg: float = 0.0
     ):
+        self.begin_interaction()
         self.camera.rotate_camera(yaw_deg, pitch_deg, roll_deg)
 
     def create_cube_3d(self, name, initial_point, size):
@@ -268,30 +400,56 @@ class GraphicSystem:
     def set_clipping_mode(self, mode):
         self.clipping_mode = mode
 
+    # Margem do guard-band em pixels (0 desliga)
+    def set_guard_band(self, margin_px):
+        self.guard_band = max(0, margin_px)
+        self.redraw()
+
     def set_curve_mode(self, mode):
         self.curve_mode = mode
         self.redraw()
 
     def clip_point(self, x, y):
-        x_min, y_min, x_max, y_max = (
-            self.window.x_min,
-            self.window.y_min,
-            self.window.x_max,
-            self.window.y_max,
-        )
-        return x_min <= x <= x_max and y_min <= y <= y_max
+        return self._clip_context().clip_point(x, y) is not None
 
     def clip_line(self, p1, p2):
-        if self.clipping_mode == "CS":
-            return cohen_sutherland(p1[0], p1[1], p2[0], p2[1], self.window)
-        else:
-            return liang_barsky(p1[0], p1[1], p2[0], p2[1], self.window)
+        return self._clip_context().clip_line(p1[0], p1[1], p2[0], p2[1])
 
     def clip_polygon(self, points):
-        return sutherland_hodgman(points, self.window)
+        return self._clip_context().clip_polygon(points)
 
+    # Pan agendado: acumula o deslocamento até o próximo quadro
     def move(self, dx, dy):
+        px, py = self._pending_pan
+        self._pending_pan = (px + dx, py + dy)
+        self.request_redraw()
+
+    # Pan: como só a posição da window muda, todo item na tela desloca pelo
+    # mesmo offset em pixels. Move tudo com um único canvas.move e só refaz os
+    # objetos que cruzam a moldura (antes ou depois do pan), i.e. os que tocam
+    # a faixa de mundo que entrou/saiu de vista.
+    def _apply_pan(self, dx, dy):
+        view = self._view_key()
+        old_ctx = self._clip_context()
         self.window.pan(dx, dy)
+        if view != self._frame_view:
+            self.redraw()  # canvas não reflete a vista atual: quadro completo
+            return
+
+        # offset em pixels do pan: parte linear da matriz composta aplicada ao
+        # deslocamento (window rotacionada gira o deslocamento)
+        a, b, _c, d, e, _f = self.viewport.matrix()
+        self.renderer.move("world", -(a * dx + b * dy), -(d * dx + e * dy))
+
+        # objetos inteiramente dentro (ou fora) da window antes e depois do pan
+        # já estão corretos na tela
+        new_view = self._view_key()
+        new_ctx = self._clip_context()
+        for obj, (_view, content) in self._drawn_keys.items():
+            bbox = self._world_bbox(obj)
+            before = old_ctx.bbox_state(bbox)
+            if before != PARTIAL and before == new_ctx.bbox_state(bbox):
+                self._drawn_keys[obj] = (new_view, content)
         self.redraw()
 
     def bind_mouse_pan(self):
@@ -309,12 +467,82 @@ class GraphicSystem:
         self.last_pan_x = event.x
         self.last_pan_y = event.y
 
+        self.begin_interaction()
         self.move(-dx, dy)
 
+    # Zoom agendado: fatores acumulados se multiplicam até o próximo quadro
     def zoom(self, factor):
-        self.window.zoom(factor)
-        self.viewport.update_rect()
-        self.redraw()
+        self.begin_interaction()
+        self._pending_zoom *= factor
+        self.request_redraw()
+
+    # Entra (ou continua) no modo interativo e reagenda o quadro de qualidade
+    # total para interactive_delay_ms depois desta entrada
+    def begin_interaction(self):
+        if not self.interactive_delay_ms:
+            return
+        self._interactive = True
+        if self._refine_job is not None:
+            self.canvas.after_cancel(self._refine_job)
+        self._refine_job = self.canvas.after(
+            self.interactive_delay_ms, self._end_interaction
+        )
+
+    def _end_interaction(self):
+        self._refine_job = None
+        if self._interactive:
+            self._interactive = False
+            self.request_redraw()
+
+    def set_max_fps(self, fps):
+        self.max_fps = fps
+
+    # Marca a vista como suja e agenda (no máximo) um quadro
+    def request_redraw(self, resize=False):
+        self._view_dirty = True
+        self._pending_resize = self._pending_resize or resize
+        if self._frame_job is not None:
+            return
+        delay = 0.0
+        if self.max_fps:
+            elapsed = time.perf_counter() - self._last_frame_time
+            delay = 1.0 / self.max_fps - elapsed
+        if delay > 0:
+            self._frame_job = self.canvas.after(int(delay * 1000), self._run_frame)
+        else:
+            self._frame_job = self.canvas.after_idle(self._run_frame)
+
+    # Executa já o quadro pendente (ex.: antes de converter um clique)
+    def flush(self):
+        if self._frame_job is None:
+            return
+        self.canvas.after_cancel(self._frame_job)
+        self._run_frame()
+
+    # Tick do agendador: aplica os deltas acumulados e redesenha uma vez
+    def _run_frame(self):
+        self._frame_job = None
+        if not self._view_dirty:
+            return
+        self._view_dirty = False
+        self._last_frame_time = time.perf_counter()
+
+        dx, dy = self._pending_pan
+        factor = self._pending_zoom
+        resize = self._pending_resize
+        self._pending_pan = (0.0, 0.0)
+        self._pending_zoom = 1.0
+        self._pending_resize = False
+
+        if factor != 1.0:
+            self.window.zoom(factor)
+            resize = True
+        if resize:
+            self.viewport.update_rect()
+        if dx or dy:
+            self._apply_pan(dx, dy)  # só pan: usa o caminho rápido de canvas.move
+        else:
+            self.redraw()
 
     def bind_mouse_scroll(self):
         # Windows e macOS
@@ -347,140 +575,373 @@ class GraphicSystem:
         self.coords_label.config(text=f"{obj.name}: {coords_str}")
 
     def redraw(self):
-        self.canvas.delete("all")
-        self.viewport.draw_frame(color="red")
+        self._update_auto_clip_mode()
+        renderer = self.renderer
+        renderer.begin_frame()
+        guard_band = self.guard_band > 0
+        mask = self.canvas.cget("bg") if guard_band else None
+        self.viewport.draw_frame(renderer, color="red", mask=mask)
+
+        # só visita os objetos que o índice espacial diz tocarem a window, e
+        # só regera as primitivas dos que tiveram entradas alteradas
+        view = self._view_key()
+        drawn = {}
+        visible = self.display.visible(self._clip_context().world_bbox)
+        self._tessellate_pending_curves(visible)
+        for obj in visible:
+            key = (view, self._content_key(obj))
+            if self._drawn_keys.get(obj) == key:
+                renderer.keep(obj)
+            else:
+                renderer.draw(obj, self._object_primitives(obj), group="world")
+            drawn[obj] = key
+        self._drawn_keys = drawn
+        self._frame_view = view
+        self._purge_stage_cache()
+
+        renderer.draw("preview", self._preview_primitives(), group="world")
+        renderer.end_frame()
+        if guard_band:
+            renderer.raise_group("overlay")  # máscara e moldura sempre por cima
+
+    # Estado da vista 2D (window, viewport, modo de clipping e qualidade)
+    def _view_key(self):
+        return (
+            self.window.version,
+            self.viewport.version,
+            self.clipping_mode,
+            self.guard_band,
+            self._interactive,
+        )
 
-        for obj in self.display.objects:
-            # Objetos 3D
-            if isinstance(obj, Object3D):
-                if obj.type == SURFACE:
-                    # desenha a malha da superfície
-                    self._draw_surface_object(obj)
-                    continue
-
-                projected_edges = obj.project(self.camera)
-                for (x1, y1), (x2, y2) in projected_edges:
-                    # clipping 2D para objetos 3D
-                    self._draw_clipped_world_segment(x1, y1, x2, y2, obj.color)
-                continue
+    # Contexto de clipping (rotação da window, inversa e limites alinhados),
+    # refeito só quando a window ou o modo de clipping mudam
+    def _clip_context(self):
+        mode = self.clipping_mode
+        if mode == "AUTO":
+            mode = self._auto_clip_mode
+        key = (
+            self.window.version,
+            self.viewport.version,
+            self.guard_band,
+            self.clipping_mode,
+            mode,
+        )
+        if self._clip_ctx is None or self._clip_ctx[0] != key:
+            ctx = self._make_clip_context(mode)
+            if self.clipping_mode == "AUTO":
+                ctx.stats = self._clip_stats
+            self._clip_ctx = (key, ctx)
+        return self._clip_ctx[1]
+
+    # Com guard-band, recorta contra a window alargada pela margem (convertida
+    # de pixels para unidades de mundo)
+    def _make_clip_context(self, mode):
+        w = self.window
+        if self.guard_band <= 0:
+            return ClipContext.from_window(w, mode)
+        vp = self.viewport
+        gx = self.guard_band * w.width() / max(vp.px1 - vp.px0, 1)
+        gy = self.guard_band * w.height() / max(vp.py1 - vp.py0, 1)
+        return ClipContext(
+            w.x_min - gx,
+            w.y_min - gy,
+            w.x_max + gx,
+            w.y_max + gy,
+            w.rotation_angle,
+            mode,
+        )
+
+    # Modo "AUTO": escolhe o algoritmo de reta do quadro a partir das
+    # proporções (dentro, fora, cruzando) observadas no quadro anterior
+    def _update_auto_clip_mode(self):
+        if self.clipping_mode != "AUTO":
+            return
+        stats = self._clip_stats
+        if sum(stats):
+            self._auto_clip_mode = choose_line_clipper(*stats)
+            stats[:] = [0, 0, 0]
+
+    # Caixa envolvente (mundo 2D) da geometria desenhada do objeto
+    def _world_bbox(self, obj):
+        if not isinstance(obj, Object3D):
+            if obj.obj_type == CURVE:
+                # caixa das amostras da curva (mais justa que a dos controles)
+                inputs = self._curve_inputs(obj)
+                return self._stage(
+                    "bbox", obj, inputs, lambda: _bbox_of(self._curve_points(obj))
+                )
+            return obj.bbox()
+        geometry = (self._geometry_key(obj), self.camera.version)
+        return self._stage(
+            "bbox", obj, geometry, lambda: _bbox_of(self._projected_points(obj))
+        )
+
+    # Todos os pontos 2D (mundo) da projeção de um objeto 3D
+    def _projected_points(self, obj):
+        if obj.type == SURFACE:
+            return [p for line in self._projected_isolines(obj) for p in line]
+        return [p for edge in self._projected_edges(obj) for p in edge]
+
+    # Chave de geometria: versão do objeto + densidade de amostragem da malha
+    def _geometry_key(self, obj):
+        if isinstance(obj, Object3D) and obj.type == SURFACE:
+            if self._surface_lod(obj):
+                return (surface_version(obj), self._surface_densities(obj))
+            patches = getattr(obj, "patches", None) or [obj]
+            return (surface_version(obj),) + tuple(
+                (getattr(p, "nu", None), getattr(p, "nv", None)) for p in patches
+            )
+        return obj.version
 
-            # PONTO
-            if obj.obj_type == POINT:
-                if obj.coordinates:
-                    px, py = obj.coordinates[0]
-                    inside = self._clip_point_world(px, py)
-                    if inside:
-                        x, y = self.viewport.world_to_viewport(px, py)
-                        self.canvas.create_oval(
-                            x - 3,
-                            y - 3,
-                            x + 3,
-                            y + 3,
-                            fill=obj.color,
-                            outline=obj.color,
+    # Tudo (além da vista 2D) que influencia as primitivas de um objeto
+    def _content_key(self, obj):
+        if isinstance(obj, Object3D):
+            return (self._geometry_key(obj), self.camera.version, obj.color)
+        return (
+            obj.version,
+            obj.obj_type,
+            obj.color,
+            obj.fill_color,
+            obj.filled,
+            obj.curve_mode,
+        )
+
+    # Resultado de um estágio do pipeline, recalculado só se as entradas mudaram
+    def _stage(self, stage, obj, inputs, compute):
+        cache = self._stage_cache.setdefault(stage, {})
+        hit = cache.get(obj)
+        if hit is not None and hit[0] == inputs:
+            return hit[1]
+        value = compute()
+        cache[obj] = (inputs, value)
+        return value
+
+    # Descarta estágios de objetos que saíram do display file
+    def _purge_stage_cache(self):
+        if self._purged_version == self.display.version:
+            return
+        self._purged_version = self.display.version
+        for cache in self._stage_cache.values():
+            for obj in [o for o in cache if o not in self.display]:
+                del cache[obj]
+        self.tessellation_cache.discard(lambda key: key[0] not in self.display)
+        self.mesh_cache.discard(lambda surface: surface not in self.display)
+
+    # Gera as primitivas (já em pixels) que representam um objeto do display file
+    def _object_primitives(self, obj):
+        out = []
+
+        # aceitação/rejeição trivial pela caixa envolvente: objeto todo fora é
+        # descartado; todo dentro vai direto para a viewport sem clipping; só
+        # os que cruzam a borda da window passam pelos algoritmos de clipping
+        state = self._clip_context().bbox_state(self._world_bbox(obj))
+        if state == OUTSIDE:
+            return out
+        clip = state == PARTIAL
+
+        # Objetos 3D
+        if isinstance(obj, Object3D):
+            if obj.type == SURFACE:
+                # desenha a malha da superfície
+                self._draw_surface_object(out, obj, clip)
+                return out
+
+            # clipping 2D (em lote) para objetos 3D
+            segments = [
+                (x1, y1, x2, y2) for (x1, y1), (x2, y2) in self._projected_edges(obj)
+            ]
+            self._draw_world_segments(out, segments, obj.color, clip)
+            return out
+
+        # PONTO
+        if obj.obj_type == POINT:
+            if obj.coordinates:
+                px, py = obj.coordinates[0]
+                inside = not clip or self._clip_context().clip_point(px, py)
+                if inside:
+                    x, y = self.viewport.world_to_viewport(px, py)
+                    out.append(
+                        (
+                            "oval",
+                            (x - 3, y - 3, x + 3, y + 3),
+                            {"fill": obj.color, "outline": obj.color},
                         )
+                    )
 
-            # RETA
-            elif obj.obj_type == LINE:
-                if len(obj.coordinates) >= 2:
-                    x1, y1 = obj.coordinates[0]
-                    x2, y2 = obj.coordinates[1]
-                    self._draw_clipped_world_segment(x1, y1, x2, y2, obj.color)
-
-            # POLÍGONO
-            elif obj.obj_type == WIREFRAME:
-                if len(obj.coordinates) >= 3:
-                    clipped_poly = self._clip_polygon_world(obj.coordinates)
+        # RETA
+        elif obj.obj_type == LINE:
+            if len(obj.coordinates) >= 2:
+                x1, y1 = obj.coordinates[0]
+                x2, y2 = obj.coordinates[1]
+                self._draw_world_segments(out, [(x1, y1, x2, y2)], obj.color, clip)
+
+        # POLÍGONO
+        elif obj.obj_type == WIREFRAME:
+            if len(obj.coordinates) >= 3:
+                coords = obj.coordinates
+                ctx = self._clip_context()
+                if getattr(obj, "filled", False) and not self._interactive:
+                    # preenchido: Weiler-Atherton separa os pedaços de polígonos
+                    # côncavos em vez de ligá-los por arestas sobre a borda (só
+                    # vale para polígonos sem auto-interseção)
+                    if not clip:
+                        parts = [coords]
+                    elif self._is_simple(obj):
+                        parts = ctx.clip_polygon_parts(coords)
+                    else:
+                        parts = [ctx.clip_polygon(coords)]
+                    opts = {"outline": obj.color, "fill": (obj.fill_color or obj.color)}
+                    for part in parts:
+                        if len(part) >= 3:
+                            flat = self.viewport.world_to_viewport_flat(part)
+                            out.append(("polygon", flat, opts))
+                else:
+                    clipped_poly = ctx.clip_polygon(coords) if clip else coords
                     # pode acontecer de virar segmentinho/degenerado após clip
                     if clipped_poly and len(clipped_poly) >= 2:
-                        pv = [
-                            self.viewport.world_to_viewport(x, y)
-                            for (x, y) in clipped_poly
-                        ]
-                        if getattr(obj, "filled", False) and len(pv) >= 3:
-                            flat = [v for p in pv for v in p]
-                            self.canvas.create_polygon(
-                                *flat,
-                                outline=obj.color,
-                                fill=(obj.fill_color or obj.color),
+                        # contorno fechado numa única linha do canvas
+                        closed = list(clipped_poly) + [clipped_poly[0]]
+                        out.append(
+                            (
+                                "line",
+                                self.viewport.world_to_viewport_flat(closed),
+                                {"fill": obj.color},
                             )
-                        else:
-                            for i in range(len(pv)):
-                                x1, y1 = pv[i]
-                                x2, y2 = pv[(i + 1) % len(pv)]
-                                self.canvas.create_line(x1, y1, x2, y2, fill=obj.color)
-
-            # CURVA
-            elif obj.obj_type == CURVE:
-                if len(obj.coordinates) >= 2:
-                    mode = getattr(obj, "curve_mode", "G0")
-                    if mode == "G0":
-                        curve_pts = bezier_multisegment(
-                            obj.coordinates, num_samples=200
                         )
-                    elif mode == "G1":
-                        curve_pts = bezier_curve(obj.coordinates, num_samples=200)
-                    elif mode == "BS":
-                        curve_pts = evaluate_bspline_fd(obj.coordinates, num_samples=50)
-                    else:
-                        curve_pts = []
 
-                    for i in range(len(curve_pts) - 1):
-                        x1, y1 = curve_pts[i]
-                        x2, y2 = curve_pts[i + 1]
-                        self._draw_clipped_world_segment(x1, y1, x2, y2, obj.color)
+        # CURVA
+        elif obj.obj_type == CURVE:
+            if len(obj.coordinates) >= 2:
+                curve_pts = self._curve_points(obj)
+                self._draw_world_polylines(out, [curve_pts], obj.color, clip)
 
-        # Desenhar pontos temporários para linhas e wireframes em construção
-        if self.current_type in [WIREFRAME, LINE, CURVE] and self.current_points:
-            p_coords = [
-                self.viewport.world_to_viewport(x, y) for (x, y) in self.current_points
-            ]
+        return out
 
-            for px, py in p_coords:
-                self.canvas.create_oval(
-                    px - 3, py - 3, px + 3, py + 3, outline="red", fill="red"
+    # Polígono sem auto-interseção? (verificado uma vez por versão do objeto)
+    def _is_simple(self, obj):
+        return self._stage(
+            "simple", obj, obj.version, lambda: is_simple_polygon(obj.coordinates)
+        )
+
+    # Amostras (mundo) de uma curva, vindas do cache de tesselação quando a
+    # curva já foi tesselada com a mesma versão, modo e tolerância
+    def _curve_points(self, obj):
+        inputs = self._curve_inputs(obj)
+        key = (obj,) + inputs
+        samples = self.tessellation_cache.get(key)
+        if samples is not None:
+            return unpack_points(samples)
+        points = self._tessellate_curve(obj.coordinates, inputs[1], inputs[2])
+        self.tessellation_cache.put(key, pack_points(points))
+        return points
+
+    # Entradas da tesselação de uma curva: versão, modo e tolerância
+    def _curve_inputs(self, obj):
+        return (obj.version, getattr(obj, "curve_mode", "G0"), self._curve_tolerance())
+
+    # Tolerância do achatamento em unidades do mundo, arredondada para baixo
+    # a uma potência de 2: um zoom só refaz as curvas ao cruzar um fator 2
+    def _curve_tolerance(self):
+        tolerance = self.curve_tolerance
+        if self._interactive:
+            tolerance = self.interactive_curve_tolerance
+        if not tolerance:
+            return None
+        level = math.floor(math.log2(self.viewport.world_per_pixel()))
+        return tolerance * 2.0**level
+
+    # Amostras (mundo) de uma curva conforme o modo
+    def _tessellate_curve(self, coords, mode, tolerance=None):
+        if tolerance is not None:
+            return flatten_curve(coords, mode, tolerance)
+        if mode == "G0":
+            return bezier_multisegment(coords, num_samples=CURVE_SAMPLES["G0"])
+        elif mode == "G1":
+            return bezier_curve(coords, num_samples=CURVE_SAMPLES["G1"])
+        elif mode == "BS":
+            return evaluate_bspline_fd(coords, num_samples=CURVE_SAMPLES["BS"])
+        return []
+
+    # Tessela de uma vez (em lote) as curvas visíveis cujas amostras não estão
+    # no cache de tesselação, deixando-as prontas para _curve_points. Sem
+    # NumPy o lote não ganha nada e cada curva é tesselada ao ser desenhada
+    def _tessellate_pending_curves(self, objects):
+        if not VECTORIZED:
+            return
+        cache = self.tessellation_cache
+        pending = []
+        for obj in objects:
+            if isinstance(obj, Object3D) or obj.obj_type != CURVE:
+                continue
+            key = (obj,) + self._curve_inputs(obj)
+            if key not in cache:  # sem contar como acerto/falha
+                pending.append((obj, key))
+        if len(pending) < 2:
+            return
+        flat, offsets = tessellate_batch(
+            [(obj.coordinates, key[2]) for obj, key in pending],
+            tolerance=pending[0][1][3],
+        )
+        for i, (_obj, key) in enumerate(pending):
+            cache.put(key, flat[2 * offsets[i] : 2 * offsets[i + 1]], prefetch=True)
+
+    # Pontos temporários para linhas e wireframes em construção
+    def _preview_primitives(self):
+        out = []
+        if self.current_type not in [WIREFRAME, LINE, CURVE] or not self.current_points:
+            return out
+
+        p_coords = self.viewport.world_to_viewport_many(self.current_points)
+
+        for px, py in p_coords:
+            out.append(
+                (
+                    "oval",
+                    (px - 3, py - 3, px + 3, py + 3),
+                    {"outline": "red", "fill": "red"},
                 )
+            )
+
+        # Linhas de prévia entre os pontos já clicados para wireframes
+        if len(p_coords) >= 2 and self.current_type == WIREFRAME:
+            for i in range(len(p_coords) - 1):
+                x1, y1 = p_coords[i]
+                x2, y2 = p_coords[i + 1]
+                out.append(("line", (x1, y1, x2, y2), {"dash": (3, 3)}))
 
-            # Linhas de prévia entre os pontos já clicados para wireframes
-            if len(p_coords) >= 2 and self.current_type == WIREFRAME:
+        # Prévia para curva de bézier ou B-Spline
+        elif self.current_type == CURVE:
+            if len(p_coords) >= 2:
                 for i in range(len(p_coords) - 1):
                     x1, y1 = p_coords[i]
                     x2, y2 = p_coords[i + 1]
-                    self.canvas.create_line(x1, y1, x2, y2, dash=(3, 3))
-
-            # Prévia para curva de bézier ou B-Spline
-            elif self.current_type == CURVE:
-                if len(p_coords) >= 2:
-                    for i in range(len(p_coords) - 1):
-                        x1, y1 = p_coords[i]
-                        x2, y2 = p_coords[i + 1]
-                        self.canvas.create_line(
-                            x1, y1, x2, y2, dash=(2, 4), fill="gray"
-                        )
+                    out.append(
+                        ("line", (x1, y1, x2, y2), {"dash": (2, 4), "fill": "gray"})
+                    )
 
-                if len(self.current_points) >= 3:
-                    mode = getattr(self, "curve_mode", "G0")
-                    if mode == "G0":
-                        curve_pts = bezier_multisegment(
-                            self.current_points, num_samples=100
-                        )
-                    elif mode == "G1":
-                        curve_pts = bezier_curve(self.current_points, num_samples=100)
-                    elif mode == "BS":
-                        curve_pts = evaluate_bspline_fd(
-                            self.current_points, num_samples=50
-                        )
-                    else:
-                        curve_pts = []
-                    v_coords = [
-                        self.viewport.world_to_viewport(x, y) for (x, y) in curve_pts
-                    ]
-                    for i in range(len(v_coords) - 1):
-                        x1, y1 = v_coords[i]
-                        x2, y2 = v_coords[i + 1]
-                        self.canvas.create_line(x1, y1, x2, y2, fill="blue")
+            if len(self.current_points) >= 3:
+                mode = getattr(self, "curve_mode", "G0")
+                if mode == "G0":
+                    curve_pts = bezier_multisegment(
+                        self.current_points, num_samples=100
+                    )
+                elif mode == "G1":
+                    curve_pts = bezier_curve(self.current_points, num_samples=100)
+                elif mode == "BS":
+                    curve_pts = evaluate_bspline_fd(self.current_points, num_samples=50)
+                else:
+                    curve_pts = []
+                v_coords = self.viewport.world_to_viewport_many(curve_pts)
+                for i in range(len(v_coords) - 1):
+                    x1, y1 = v_coords[i]
+                    x2, y2 = v_coords[i + 1]
+                    out.append(("line", (x1, y1, x2, y2), {"fill": "blue"}))
+
+        return out
 
     def on_click(self, event):
+        self.flush()  # a conversão precisa da vista com pan/zoom já aplicados
         # converter clique para coordenadas do mundo
         xw, yw = self.viewport.viewport_to_world(event.x, event.y)
         self.current_points.append((xw, yw))
@@ -621,8 +1082,7 @@ class GraphicSystem:
         if tz is None:
             return
 
-        for p in obj._unique_points():  # evita transformar um vértice repetido
-            p.translate(tx, ty, tz)
+        obj.translate(tx, ty, tz)  # evita transformar um vértice repetido
 
         self.redraw()
         self.refresh_listbox()
@@ -753,8 +1213,7 @@ class GraphicSystem:
             if cz is None:
                 return
 
-        for p in obj._unique_points():  # evita escalonar vértice repetido
-            p.scale(sx, sy, sz, cx, cy, cz)
+        obj.scale(sx, sy, sz, cx, cy, cz)  # evita escalonar vértice repetido
 
         self.redraw()
         self.refresh_listbox()
@@ -1105,171 +1564,134 @@ class GraphicSystem:
 
 
 
-    # Recebe Point3D OU tupla (x,y,z) e devolve (x2d, y2d) no espaço de MUNDO 2D
-    def _project3d_to2d_world(self, p3):
+    # Recebe Point3D OU tupla (x,y,z) e devolve (xc, yc, zc) em coordenadas de câmera
+    def _world_to_camera(self, p3):
         if hasattr(p3, "x"):
             x, y, z = p3.x, p3.y, p3.z
         else:
             x, y, z = p3
-        x2d, y2d = self.camera.project_point((x, y, z))
-        return (x2d, y2d)
-
-    # Desenha superfície bicúbica como uma malha
-    def _draw_surface_object(self, surface_obj):
-        # Caso seja B-spline (tem generate_mesh)
-        if hasattr(surface_obj, "generate_mesh"):
-            grids = surface_obj.generate_mesh()
-            for grid3d in grids:
-                grid2d = [
-                    [self._project3d_to2d_world(p) for p in row] for row in grid3d
-                ]
-                # desenhe linhas u e v como já faz
-                for j in range(len(grid2d[0])):  # v fixo, percorre u
-                    for i in range(len(grid2d) - 1):
-                        x1, y1 = grid2d[i][j]
-                        x2, y2 = grid2d[i + 1][j]
-                        self._draw_clipped_world_segment(
-                            x1, y1, x2, y2, surface_obj.color
-                        )
-                for i in range(len(grid2d)):  # u fixo, percorre v
-                    for j in range(len(grid2d[0]) - 1):
-                        x1, y1 = grid2d[i][j]
-                        x2, y2 = grid2d[i][j + 1]
-                        self._draw_clipped_world_segment(
-                            x1, y1, x2, y2, surface_obj.color
-                        )
-            return
-
-        # Caso seja Bézier (tem patches)
-        patches = []
-        if hasattr(surface_obj, "patches") and surface_obj.patches:
-            patches = surface_obj.patches
-        elif hasattr(surface_obj, "control"):
-            patches = [surface_obj]
-        else:
-            return  # nada a desenhar
-
-        for patch in patches:
-            # gera grid para superfície 3d
-            grid3d = generate_surface_grid(patch.control, patch.nu, patch.nv)
-
-            # Projeta todos em 2D (mundo)
-            grid2d = [[self._project3d_to2d_world(p) for p in row] for row in grid3d]
-
-            # Linhas em u (varia i, j fixo)
-            for j in range(len(grid2d[0])):  # nv+1
-                for i in range(len(grid2d) - 1):  # nu
-                    x1, y1 = grid2d[i][j]
-                    x2, y2 = grid2d[i + 1][j]
-                    self._draw_clipped_world_segment(x1, y1, x2, y2, surface_obj.color)
-
-            # Linhas em v (varia j, i fixo)
-            for i in range(len(grid2d)):  # nu+1
-                for j in range(len(grid2d[0]) - 1):  # nv
-                    x1, y1 = grid2d[i][j]
-                    x2, y2 = grid2d[i][j + 1]
-                    self._draw_clipped_world_segment(x1, y1, x2, y2, surface_obj.color)
-
-    # Helpers para clipping correto com janela possivelmente rotacionada
-    def _rotate_point(self, x, y, ang_deg, cx, cy):
-        import math
-
-        a = math.radians(ang_deg)
-        ca, sa = math.cos(a), math.sin(a)
-        xr, yr = x - cx, y - cy
-        return (xr * ca - yr * sa + cx, xr * sa + yr * ca + cy)
-
-    # Clipping para pontos
-    def _clip_point_world(self, x, y):
-        cx = (self.window.x_min + self.window.x_max) / 2.0
-        cy = (self.window.y_min + self.window.y_max) / 2.0
-        ang = self.window.rotation_angle
-        if abs(ang) > 1e-9:
-            xr, yr = self._rotate_point(x, y, +ang, cx, cy)  # mesmo sentido
-            res = clip_point(xr, yr, self.window)
-            if res is None:
-                return None
-            wx, wy = self._rotate_point(res[0], res[1], -ang, cx, cy)
-            return (wx, wy)
-        else:
-            res = clip_point(x, y, self.window)
-        return (x, y) if res is not None else None
-
-    # Clipping para retas respeitando as coordenadas de mundo e rotação de janela
-    def _clip_line_world(self, p1, p2):
-        # Centro da window (para rotacionar em torno dele)
-        cx = (self.window.x_min + self.window.x_max) / 2.0
-        cy = (self.window.y_min + self.window.y_max) / 2.0
-        ang = self.window.rotation_angle
-
-        # Des-rotaciona os pontos para alinhar com os eixos da janela
-        if abs(ang) > 1e-9:
-            q1 = self._rotate_point(p1[0], p1[1], +ang, cx, cy)
-            q2 = self._rotate_point(p2[0], p2[1], +ang, cx, cy)
-
-            # cria uma "cópia" rasa da janela (mesmos limites)
-            class _TmpW:
-                pass
-
-            w = _TmpW()
-            w.x_min, w.x_max = self.window.x_min, self.window.x_max
-            w.y_min, w.y_max = self.window.y_min, self.window.y_max
-
-            if self.clipping_mode == "CS":
-                clipped = cohen_sutherland(q1[0], q1[1], q2[0], q2[1], w)
-            else:
-                clipped = liang_barsky(q1[0], q1[1], q2[0], q2[1], w)
-
-            if not clipped:
-                return None
-
-            x1c, y1c, x2c, y2c = clipped
-            # re-rotaciona de volta para o mundo
-            r1 = self._rotate_point(x1c, y1c, -ang, cx, cy)
-            r2 = self._rotate_point(x2c, y2c, -ang, cx, cy)
-            return (r1[0], r1[1], r2[0], r2[1])
-        else:
-            # janela não-rotacionada: clipping direto
-            if self.clipping_mode == "CS":
-                return cohen_sutherland(p1[0], p1[1], p2[0], p2[1], self.window)
-            else:
-                return liang_barsky(p1[0], p1[1], p2[0], p2[1], self.window)
-
-    # Clipping para polígonos/wireframes respeitando as coordenadas de mundo e rotação de janela
-    def _clip_polygon_world(self, points):
-        if not points:
-            return []
-
-        cx = (self.window.x_min + self.window.x_max) / 2.0
-        cy = (self.window.y_min + self.window.y_max) / 2.0
-        ang = self.window.rotation_angle
-
-        # Se houver rotação: leva pro espaço alinhado à janela
-        if abs(ang) > 1e-9:
-            pts_local = [self._rotate_point(x, y, +ang, cx, cy) for (x, y) in points]
-
-            class _TmpW:
-                pass
+        return self.camera.world_to_camera((x, y, z))
+
+    # Arestas do objeto 3D projetadas no mundo 2D
+    def _projected_edges(self, obj):
+        return self._stage(
+            "project",
+            obj,
+            (obj.version, self.camera.version),
+            lambda: obj.project(self.camera),
+        )
 
-            w = _TmpW()
-            w.x_min, w.x_max = self.window.x_min, self.window.x_max
-            w.y_min, w.y_max = self.window.y_min, self.window.y_max
+    # Densidades (nu, nv) de cada retalho pelo tamanho projetado na tela,
+    # nunca abaixo das divisões nu x nv do objeto (as dos diálogos de
+    # superfície); os comprimentos projetados só são refeitos se a câmera ou
+    # o objeto mudou. Retalhos fora da window ficam com a densidade mínima
+    def _surface_densities(self, surface_obj):
+        lengths = self._stage(
+            "lod",
+            surface_obj,
+            (surface_version(surface_obj), self.camera.version),
+            lambda: surface_patch_lengths(surface_obj, self.camera),
+        )
+        return patch_densities(
+            lengths,
+            self.viewport.world_per_pixel(),
+            self._clip_context().world_bbox,
+            self._lod_pixels(),
+            fixed_densities(surface_obj, len(lengths)),
+        )
 
-            clipped_local = sutherland_hodgman(pts_local, w)
-            if not clipped_local:
-                return []
+    # LOD em tela ligado para a superfície (lod=False no objeto: só nu x nv)
+    def _surface_lod(self, surface_obj):
+        return bool(self._lod_pixels()) and getattr(surface_obj, "lod", True)
+
+    # Pixels por segmento de malha do LOD (mais grosseiro no modo interativo)
+    def _lod_pixels(self):
+        if self._interactive:
+            return self.interactive_lod_pixels
+        return self.surface_lod_pixels
+
+    # Malhas 3D (mundo) da superfície: uma grade por retalho, vindas do cache
+    # de malhas (só os retalhos com geometria ou densidade nova são gerados)
+    def _surface_grids_3d(self, surface_obj):
+        densities = None
+        if self._surface_lod(surface_obj):
+            densities = self._surface_densities(surface_obj)
+        return self.mesh_cache.grids(surface_obj, densities)
+
+    # Isolinhas da superfície projetadas em 2D (mundo) e já recortadas contra
+    # os planos near/far; só refaz a projeção se a câmera ou a malha mudou
+    def _projected_isolines(self, surface_obj):
+        geometry = self._geometry_key(surface_obj)
+        return self._stage(
+            "project",
+            surface_obj,
+            (geometry, self.camera.version),
+            lambda: self._project_isolines(self._surface_grids_3d(surface_obj)),
+        )
 
-            # Volta pro mundo rotacionando de novo
-            return [self._rotate_point(x, y, -ang, cx, cy) for (x, y) in clipped_local]
+    # Cada grade vira suas linhas em u (varia i, j fixo) seguidas das linhas
+    # em v (varia j, i fixo), recortadas em coordenadas de câmera antes da
+    # divisão perspectiva
+    def _project_isolines(self, grids3d):
+        camera = self.camera
+        z_near, z_far = camera.depth_range()
+        polylines = []
+        for grid3d in grids3d:
+            grid = [[self._world_to_camera(p) for p in row] for row in grid3d]
+            if all(z_near <= p[2] <= z_far for row in grid for p in row):
+                # malha toda dentro do volume de visão: projeta cada ponto uma vez
+                grid2d = [
+                    [camera.project_camera_point(*p) for p in row] for row in grid
+                ]
+                polylines.extend(
+                    [row[j] for row in grid2d] for j in range(len(grid2d[0]))
+                )
+                polylines.extend(grid2d)
+                continue
+            for j in range(len(grid[0])):
+                polylines.extend(
+                    camera.project_camera_polyline([row[j] for row in grid])
+                )
+            for row in grid:
+                polylines.extend(camera.project_camera_polyline(row))
+        return polylines
 
-        # Sem rotação: pode usar a window direto
-        return sutherland_hodgman(points, self.window) or []
+    # Desenha superfície bicúbica como uma malha
+    def _draw_surface_object(self, out, surface_obj, clip=True):
+        # cada isolinha da malha é uma polilinha (uma linha do canvas por trecho)
+        polylines = self._projected_isolines(surface_obj)
+        self._draw_world_polylines(out, polylines, surface_obj.color, clip)
+
+    # Converte segmentos do mundo em linhas do canvas.
+    # clip=False: segmentos já sabidamente dentro da window (aceite trivial)
+    def _draw_world_segments(self, out, segments, color, clip=True):
+        if clip:
+            segments = self._clip_context().clip_segments(segments)
+        a, b, c, d, e, f = self.viewport.matrix()
+        opts = {"fill": color}
+        for x1, y1, x2, y2 in segments:
+            out.append(
+                (
+                    "line",
+                    (
+                        a * x1 + b * y1 + c,
+                        d * x1 + e * y1 + f,
+                        a * x2 + b * y2 + c,
+                        d * x2 + e * y2 + f,
+                    ),
+                    opts,
+                )
+            )
 
-    def _draw_clipped_world_segment(self, x1, y1, x2, y2, color):
-        clipped = self._clip_line_world((x1, y1), (x2, y2))
-        if not clipped:
-            return
-        cx1, cy1, cx2, cy2 = clipped
-        v1 = self.viewport.world_to_viewport(cx1, cy1)
-        v2 = self.viewport.world_to_viewport(cx2, cy2)
-        self.canvas.create_line(v1, v2, fill=color)
+    # Converte polilinhas do mundo em linhas multiponto do canvas, uma por
+    # trecho visível. clip=False: polilinhas já sabidamente dentro da window
+    def _draw_world_polylines(self, out, polylines, color, clip=True):
+        ctx = self._clip_context()
+        opts = {"fill": color}
+        for points in polylines:
+            runs = ctx.clip_polyline(points) if clip else [points]
+            for run in runs:
+                if len(run) >= 2:
+                    out.append(
+                        ("line", self.viewport.world_to_viewport_flat(run), opts)
+                    )
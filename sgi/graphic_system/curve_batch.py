@@ -0,0 +1,383 @@
+from array import array
+from itertools import chain
+from operator import mul
+
+from .bezier_curve import (
+    HIGH_DEGREE,
+    M_BEZIER,
+    bernstein_table,
+    bezier_curve,
+    bezier_multisegment,
+)
+from .bspline_fd import M_BSPLINE, evaluate_bspline_fd
+from .curve_flatten import MAX_DEPTH, bezier_segments, flatten_curve
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele cada curva é avaliada em Python
+    np = None
+
+# Tesselação em lote de várias curvas (ex.: as dezenas de "curv" de um OBJ).
+#
+# As curvas são agrupadas por (modo, grau, amostragem) e, com NumPy, cada
+# grupo é avaliado de uma vez como operações sobre arrays: as Béziers de grau
+# n (G1, ou G0 com menos de 4 pontos) aplicam uma única tabela de Bernstein a
+# todas as curvas do grupo, e os trechos cúbicos de todas as curvas G0 e
+# B-Spline seguem juntos pelas forward differences. As somas são feitas na
+# mesma ordem da avaliação curva a curva, então as amostras saem idênticas às
+# de bezier_curve, bezier_multisegment e evaluate_bspline_fd.
+#
+# Com `tolerance` (unidades do mundo) as curvas são achatadas adaptativamente:
+# os trechos cúbicos de todas as curvas são subdivididos juntos, um nível de
+# De Casteljau por vez, com o mesmo critério (e o mesmo resultado) de
+# curve_flatten; as Béziers de outros graus usam bezier_segments.
+#
+# O resultado são dois arrays planos: coordenadas (x0, y0, x1, y1, ...) de
+# todas as curvas em sequência e offsets (em pontos) onde cada curva começa,
+# com offsets[i + 1] - offsets[i] amostras na curva i. Sem NumPy cada curva é
+# avaliada em Python, sem ganho sobre a tesselação individual.
+
+VECTORIZED = np is not None
+
+# Amostragem de cada modo (a mesma usada pelo GraphicSystem.redraw): G0 e
+# B-Spline por segmento, G1 na curva inteira
+CURVE_SAMPLES = {"G0": 200, "G1": 200, "BS": 50}
+
+
+# Grupo (tipo, grau) de uma curva, ou None se ela não gera amostras
+def _group_of(coords, mode):
+    if mode == "G0" and len(coords) >= 4:
+        return ("G0", 3)
+    if mode in ("G0", "G1") and coords:
+        return ("G1", len(coords) - 1)  # uma Bézier só, de grau n - 1
+    if mode == "BS" and len(coords) >= 4:
+        return ("BS", 3)
+    return None
+
+
+def _sample_count(coords, kind, num_samples):
+    if kind == "G0":
+        return (len(coords) - 1) // 3 * num_samples + 1
+    if kind == "G1":
+        return num_samples + 1
+    return (len(coords) - 3) * num_samples
+
+
+# Trechos cúbicos (4 pontos de controle) de uma curva G0 ou B-Spline
+def _cubic_pieces(coords, kind):
+    if kind == "G0":
+        return [coords[j : j + 4] for j in range(0, len(coords) - 3, 3)]
+    return [coords[j : j + 4] for j in range(len(coords) - 3)]
+
+
+# curves: sequência de (pontos de controle, modo). Devolve (coords, offsets)
+def tessellate_batch(curves, samples=CURVE_SAMPLES, tolerance=None):
+    if np is None:
+        return _tessellate_loop(curves, samples, tolerance)
+    if tolerance is not None:
+        offsets, fill = _flatten_arrays(curves, tolerance)
+    else:
+        offsets, fill = _sample_arrays(curves, samples)
+    out = np.empty((offsets[-1], 2))
+    fill(out)
+    flat = array("d")
+    flat.frombytes(out.tobytes())
+    return flat, array("l", offsets.tolist())
+
+
+# Curva a curva, em Python (sem NumPy)
+def _tessellate_loop(curves, samples, tolerance):
+    if tolerance is not None:
+        return pack_curves(
+            [flatten_curve(coords, mode, tolerance) for coords, mode in curves]
+        )
+
+    groups = {}
+    offsets = array("l", [0])
+    for i, (coords, mode) in enumerate(curves):
+        group = _group_of(coords, mode)
+        count = 0
+        if group is not None:
+            num_samples = samples[mode]
+            groups.setdefault(group + (num_samples,), []).append(i)
+            count = _sample_count(coords, group[0], num_samples)
+        offsets.append(offsets[-1] + count)
+
+    flat = array("d", bytes(16 * offsets[-1]))
+    for (kind, degree, num_samples), members in groups.items():
+        if kind == "G1" and degree <= HIGH_DEGREE:
+            table = bernstein_table(degree, num_samples)
+            for i in members:
+                coords = curves[i][0]
+                xs = [p[0] for p in coords]
+                ys = [p[1] for p in coords]
+                j = 2 * offsets[i]
+                for row in table:
+                    flat[j] = sum(map(mul, row, xs))
+                    flat[j + 1] = sum(map(mul, row, ys))
+                    j += 2
+            continue
+
+        if kind == "G1":
+            evaluate = bezier_curve  # grau alto: linhas esparsas de Bernstein
+        elif kind == "G0":
+            evaluate = bezier_multisegment
+        else:
+            evaluate = evaluate_bspline_fd
+        for i in members:
+            points = evaluate(curves[i][0], num_samples)
+            flat[2 * offsets[i] : 2 * offsets[i + 1]] = array(
+                "d", chain.from_iterable(points)
+            )
+    return flat, offsets
+
+
+def _offsets(counts):
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+# Amostragem fixa. Devolve (offsets, fill), com fill(out) escrevendo as
+# amostras de cada grupo no array (total, 2)
+def _sample_arrays(curves, samples):
+    groups = {}
+    counts = np.zeros(len(curves), dtype=np.int64)
+    for i, (coords, mode) in enumerate(curves):
+        group = _group_of(coords, mode)
+        if group is not None:
+            num_samples = samples[mode]
+            groups.setdefault(group + (num_samples,), []).append(i)
+            counts[i] = _sample_count(coords, group[0], num_samples)
+    offsets = _offsets(counts)
+
+    def fill(out):
+        for (kind, degree, num_samples), members in groups.items():
+            if kind == "G1":
+                control = [curves[i][0] for i in members]
+                starts = offsets[members]
+                _write_bezier(out, control, starts, degree, num_samples)
+                continue
+
+            control = []
+            starts = []
+            for i in members:
+                pieces = _cubic_pieces(curves[i][0], kind)
+                control.extend(pieces)
+                step = offsets[i] + num_samples * np.arange(len(pieces))
+                starts.append(step)
+            control = np.array(control, dtype=float).transpose(1, 0, 2)
+            starts = np.concatenate(starts)
+            matrix = M_BEZIER if kind == "G0" else M_BSPLINE
+            points = _fd_samples(_power_coefficients(matrix, control), num_samples)
+            out[starts[:, None] + np.arange(num_samples)] = points
+            if kind == "G0":
+                # último ponto de cada trecho: o próprio p3 (ver bezier_cubic_fd)
+                out[starts + num_samples] = control[3]
+
+    return offsets, fill
+
+
+# C = M * P para K cúbicas; control (4, K, 2). Mesma soma de bezier_cubic_fd
+def _power_coefficients(matrix, control):
+    return [sum(matrix[r][c] * control[c] for c in range(4)) for r in range(4)]
+
+
+# Forward differences de K cúbicas: amostras t = 0, 1/S, ..., (S-1)/S em um
+# array (K, S, 2). Cada sequência é uma soma acumulada (np.add.accumulate é
+# sequencial), reproduzindo os passos de bezier_cubic_fd
+def _fd_samples(coefficients, num_samples):
+    c0, c1, c2, c3 = coefficients
+    delta = 1.0 / num_samples
+    dx = (c2 + (c1 + c0 * delta) * delta) * delta
+    d2x = (2 * c1 + 6 * c0 * delta) * delta * delta
+    d3x = 6 * c0 * delta**3
+
+    shape = (len(c0), num_samples, 2)
+    second = np.empty(shape)
+    second[:, 0] = d2x
+    second[:, 1:] = d3x[:, None]
+    np.add.accumulate(second, axis=1, out=second)
+    first = np.empty(shape)
+    first[:, 0] = dx
+    first[:, 1:] = second[:, :-1]
+    np.add.accumulate(first, axis=1, out=first)
+    points = np.empty(shape)
+    points[:, 0] = c3
+    points[:, 1:] = first[:, :-1]
+    np.add.accumulate(points, axis=1, out=points)
+    return points
+
+
+# Tabela de Bernstein (S + 1, n + 1) densa; nas de grau alto os pesos fora da
+# faixa de cada linha são zero
+def _dense_table(degree, num_samples):
+    table = bernstein_table(degree, num_samples)
+    if degree <= HIGH_DEGREE:
+        return np.array(table, dtype=float)
+    dense = np.zeros((num_samples + 1, degree + 1))
+    for k, (i0, row) in enumerate(table):
+        dense[k, i0 : i0 + len(row)] = row
+    return dense
+
+
+# Escreve as num_samples + 1 amostras das Béziers de grau `degree` a partir
+# das posições `starts`. A soma percorre os pontos de controle em ordem, como
+# bezier_curve (parcelas de peso zero não mudam o resultado)
+def _write_bezier(out, control, starts, degree, num_samples):
+    table = _dense_table(degree, num_samples)
+    control = np.array(control, dtype=float)  # (M, n + 1, 2)
+    points = sum(table[:, i, None, None] * control[:, i] for i in range(degree + 1))
+    out[starts[None, :] + np.arange(num_samples + 1)[:, None]] = points
+
+
+# Achatamento adaptativo. Devolve (offsets, fill) como _sample_arrays
+def _flatten_arrays(curves, tolerance):
+    counts = np.zeros(len(curves), dtype=np.int64)
+    bezier = []  # trechos cúbicos já na forma de Bézier
+    bezier_curves = []  # curva de cada trecho
+    bspline = []  # trechos de B-Spline, convertidos abaixo
+    bspline_curves = []
+    firsts = {}  # curva -> primeiro ponto (curvas com trechos cúbicos)
+    groups = {}  # (grau, segmentos) -> curvas G1 de outros graus
+    singles = []  # curvas de um único ponto
+
+    for i, (coords, mode) in enumerate(curves):
+        group = _group_of(coords, mode)
+        if group is None:
+            continue
+        kind, degree = group
+        if kind == "BS":
+            pieces = _cubic_pieces(coords, kind)
+            bspline.extend(pieces)
+            bspline_curves.extend([i] * len(pieces))
+            counts[i] = 1
+        elif kind == "G0" or degree == 3:
+            pieces = _cubic_pieces(coords, "G0")
+            bezier.extend(pieces)
+            bezier_curves.extend([i] * len(pieces))
+            firsts[i] = coords[0]
+            counts[i] = 1
+        elif degree == 0:
+            singles.append(i)
+            counts[i] = 1
+        else:
+            segments = bezier_segments(coords, tolerance)
+            groups.setdefault((degree, segments), []).append(i)
+            counts[i] = segments + 1
+
+    control = np.empty((4, 0, 2))
+    if bezier:
+        control = np.array(bezier, dtype=float).transpose(1, 0, 2)
+    owner = np.array(bezier_curves + bspline_curves, dtype=np.int64)
+    if bspline:
+        p0, p1, p2, p3 = np.array(bspline, dtype=float).transpose(1, 0, 2)
+        converted = np.stack(
+            (
+                (p0 + 4 * p1 + p2) / 6,
+                (2 * p1 + p2) / 3,
+                (p1 + 2 * p2) / 3,
+                (p1 + 4 * p2 + p3) / 6,
+            )
+        )
+        control = np.concatenate((control, converted), axis=1)
+        # o primeiro ponto da curva é o b0 do seu primeiro trecho
+        curve_ids = np.array(bspline_curves, dtype=np.int64)
+        first = np.flatnonzero(np.r_[True, curve_ids[1:] != curve_ids[:-1]])
+        for k in first.tolist():
+            firsts[bspline_curves[k]] = converted[0, k]
+
+    # amostras (sem a primeira) de todos os trechos; os trechos de B-Spline
+    # vêm depois dos de Bézier, então reordena (estável) pela curva
+    leaf_pieces, points = _flatten_cubics(control, tolerance)
+    leaf_curves = owner[leaf_pieces]
+    order = np.argsort(leaf_curves, kind="stable")
+    leaf_curves = leaf_curves[order]
+    points = points[order]
+    counts += np.bincount(leaf_curves, minlength=len(curves))
+    offsets = _offsets(counts)
+
+    def fill(out):
+        if firsts:
+            ids = np.fromiter(firsts, dtype=np.int64, count=len(firsts))
+            out[offsets[ids]] = np.array(list(firsts.values()), dtype=float)
+        if len(points):
+            # posição de cada amostra: depois do primeiro ponto da curva e
+            # das amostras anteriores da mesma curva
+            first_leaf = np.searchsorted(leaf_curves, leaf_curves)
+            rank = np.arange(len(points)) - first_leaf
+            out[offsets[leaf_curves] + 1 + rank] = points
+        for (degree, segments), members in groups.items():
+            control = [curves[i][0] for i in members]
+            _write_bezier(out, control, offsets[members], degree, segments)
+        for i in singles:
+            out[offsets[i]] = curves[i][0][0]
+
+    return offsets, fill
+
+
+# Achatamento de K cúbicas de uma vez (control (4, K, 2)): cada nível testa a
+# planura de todos os trechos pendentes e divide ao meio (De Casteljau) os que
+# não passaram, com as mesmas contas de _flatten_cubic. Devolve (trechos,
+# pontos): o trecho de origem e o ponto final de cada sub-trecho aceito,
+# ordenados por trecho e, dentro dele, pelo parâmetro t.
+def _flatten_cubics(control, tolerance):
+    tol2 = 9 * tolerance * tolerance
+    p0, p1, p2, p3 = control
+    piece = np.arange(p0.shape[0])
+    position = np.zeros(len(piece), dtype=np.int64)  # início, em 2^-MAX_DEPTH
+    leaves = []
+
+    for depth in range(MAX_DEPTH, -1, -1):
+        a = 3 * p1 - 2 * p0 - p3
+        b = 3 * p2 - p0 - 2 * p3
+        if depth == 0:
+            done = np.ones(len(piece), dtype=bool)
+        else:
+            done = (
+                np.maximum(
+                    a[:, 0] * a[:, 0] + a[:, 1] * a[:, 1],
+                    b[:, 0] * b[:, 0] + b[:, 1] * b[:, 1],
+                )
+                <= tol2
+            )
+        leaves.append((piece[done], position[done], p3[done]))
+        split = ~done
+        if not split.any():
+            break
+
+        q0, q1, q2, q3 = p0[split], p1[split], p2[split], p3[split]
+        q01 = (q0 + q1) / 2
+        q12 = (q1 + q2) / 2
+        q23 = (q2 + q3) / 2
+        qa = (q01 + q12) / 2
+        qb = (q12 + q23) / 2
+        qm = (qa + qb) / 2
+        p0 = np.concatenate((q0, qm))
+        p1 = np.concatenate((q01, qb))
+        p2 = np.concatenate((qa, q23))
+        p3 = np.concatenate((qm, q3))
+        piece = np.concatenate((piece[split], piece[split]))
+        half = position[split]
+        position = np.concatenate((half, half + (1 << (depth - 1))))
+
+    pieces = np.concatenate([leaf[0] for leaf in leaves])
+    positions = np.concatenate([leaf[1] for leaf in leaves])
+    points = np.concatenate([leaf[2] for leaf in leaves])
+    order = np.lexsort((positions, pieces))
+    return pieces[order], points[order]
+
+
+# Empacota listas de pontos no formato (coords, offsets) de tessellate_batch
+def pack_curves(point_lists):
+    offsets = array("l", [0])
+    for points in point_lists:
+        offsets.append(offsets[-1] + len(points))
+    flat = array("d", chain.from_iterable(chain.from_iterable(point_lists)))
+    return flat, offsets
+
+
+# Amostras (x, y) da curva i de um resultado de tessellate_batch
+def curve_points(flat, offsets, i):
+    a, b = 2 * offsets[i], 2 * offsets[i + 1]
+    return list(zip(flat[a:b:2], flat[a + 1 : b : 2]))
@@ -0,0 +1,265 @@
+import math
+import random
+import time
+from fractions import Fraction
+from operator import mul
+
+from .bezier_curve import bezier_cubic_fd, bezier_curve, bezier_multisegment
+from .bspline_fd import evaluate_bspline_fd
+from .curve_batch import CURVE_SAMPLES, VECTORIZED, curve_points, tessellate_batch
+from .curve_flatten import flatten_curve
+
+# Benchmark da avaliação de curvas.
+#
+# Uso (a partir de sgi/):  python -m graphic_system.curve_benchmark
+#
+# Compara, para Béziers cúbicas G0, a avaliação por blending functions
+# (bezier_curve, um produto escalar por amostra) com forward differences
+# (bezier_cubic_fd, três somas por coordenada por amostra). A vazão é medida
+# em amostras por segundo e o erro é a maior distância (por coordenada) entre
+# as amostras dos dois métodos.
+#
+# Para Béziers de grau alto (G1 com muitos pontos) compara bezier_curve com a
+# fórmula direta binomial * potências e com De Casteljau; ali o erro é medido
+# contra a curva calculada em aritmética exata.
+#
+# Por fim compara a tesselação curva a curva com tessellate_batch (vetorizada
+# quando há NumPy), com amostragem fixa e achatamento adaptativo; ali o erro é
+# a maior diferença entre as amostras dos dois caminhos.
+
+DEFAULT_SAMPLES = [10, 50, 200, 1000]
+DEFAULT_POINTS = [10, 50, 200]
+DEFAULT_MODES = [("G0",), ("G1",), ("BS",), ("G0", "G1", "BS")]
+DEFAULT_TOLERANCES = [None, 0.25]
+
+# pontos de controle de cada modo nas cargas do lote
+_BATCH_POINTS = {"G0": 7, "G1": 5, "BS": 7}
+_EVALUATORS = {
+    "G0": bezier_multisegment,
+    "G1": bezier_curve,
+    "BS": evaluate_bspline_fd,
+}
+
+
+def make_cubic_segments(n, seed=0, extent=500.0):
+    rnd = random.Random(seed)
+    return [
+        [(rnd.uniform(-extent, extent), rnd.uniform(-extent, extent)) for _ in range(4)]
+        for _ in range(n)
+    ]
+
+
+def _timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _max_error(curves_a, curves_b):
+    return max(
+        max(abs(xa - xb), abs(ya - yb))
+        for ca, cb in zip(curves_a, curves_b)
+        for (xa, ya), (xb, yb) in zip(ca, cb)
+    )
+
+
+# Mede os dois métodos sobre os segmentos; devolve {método: amostras/s} e o
+# erro máximo de forward differences em relação às blending functions
+def bench_cubic(segments, num_samples, repeat=3):
+    runs = {
+        "blending": lambda: [bezier_curve(s, num_samples) for s in segments],
+        "fd": lambda: [bezier_cubic_fd(s, num_samples) for s in segments],
+    }
+    n = len(segments) * (num_samples + 1)
+    rates = {name: n / max(_timed(run, repeat), 1e-12) for name, run in runs.items()}
+    error = _max_error(runs["blending"](), runs["fd"]())
+    return rates, error
+
+
+# Roda todas as densidades e devolve linhas (amostras, método, vazão, erro)
+def run_benchmark(n_segments=500, samples=DEFAULT_SAMPLES, repeat=3, seed=0):
+    segments = make_cubic_segments(n_segments, seed)
+    rows = []
+    for num_samples in samples:
+        rates, error = bench_cubic(segments, num_samples, repeat)
+        for name, rate in rates.items():
+            rows.append((num_samples, name, rate, error))
+    return rows
+
+
+# Polígono de controle longe da origem (onde o arredondamento pesa mais)
+def make_control_polygon(n_points, seed=0, extent=500.0, offset=5000.0):
+    rnd = random.Random(seed)
+    return [
+        (offset + rnd.uniform(-extent, extent), offset + rnd.uniform(-extent, extent))
+        for _ in range(n_points)
+    ]
+
+
+# Tabela pela fórmula direta: binomial * (1 - t)^(n - i) * t^i
+def _binomial_table(n, num_samples):
+    binomials = [math.comb(n, i) for i in range(n + 1)]
+    return [
+        [
+            binomials[i] * (1 - t) ** (n - i) * t**i
+            for i in range(n + 1)
+            for t in (t_i / num_samples,)
+        ]
+        for t_i in range(num_samples + 1)
+    ]
+
+
+def _binomial_curve(points, table):
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return [(sum(map(mul, row, xs)), sum(map(mul, row, ys))) for row in table]
+
+
+def de_casteljau(points, num_samples):
+    n = len(points) - 1
+    curve = []
+    for t_i in range(num_samples + 1):
+        t = t_i / num_samples
+        temp = list(points)
+        for r in range(1, n + 1):
+            for i in range(n - r + 1):
+                x = (1 - t) * temp[i][0] + t * temp[i + 1][0]
+                y = (1 - t) * temp[i][1] + t * temp[i + 1][1]
+                temp[i] = (x, y)
+        curve.append(temp[0])
+    return curve
+
+
+# Amostras exatas (arredondadas só no final) a cada `step` amostras
+def _exact_curve(points, num_samples, step):
+    n = len(points) - 1
+    binomials = [math.comb(n, i) for i in range(n + 1)]
+    xs = [Fraction(p[0]) for p in points]
+    ys = [Fraction(p[1]) for p in points]
+    out = {}
+    for t_i in range(0, num_samples + 1, step):
+        weights = [
+            binomials[i] * (num_samples - t_i) ** (n - i) * t_i**i for i in range(n + 1)
+        ]
+        scale = num_samples**n
+        out[t_i] = (
+            float(sum(map(mul, weights, xs)) / scale),
+            float(sum(map(mul, weights, ys)) / scale),
+        )
+    return out
+
+
+# Mede uma Bézier de n_points pontos de controle; devolve {método: amostras/s}
+# e {método: erro máximo em relação à curva exata}. As tabelas de pesos já
+# estão prontas quando o tempo é medido (como no redraw, que as reaproveita).
+def bench_high_degree(n_points, num_samples=200, n_curves=5, repeat=3, seed=0):
+    curves = [make_control_polygon(n_points, seed + k) for k in range(n_curves)]
+    table = _binomial_table(n_points - 1, num_samples)
+    bezier_curve(curves[0], num_samples)
+    runs = {
+        "binomial": lambda: [_binomial_curve(c, table) for c in curves],
+        "estável": lambda: [bezier_curve(c, num_samples) for c in curves],
+        "casteljau": lambda: [de_casteljau(c, num_samples) for c in curves],
+    }
+    n = n_curves * (num_samples + 1)
+    rates = {name: n / max(_timed(run, repeat), 1e-12) for name, run in runs.items()}
+
+    step = max(1, num_samples // 20)
+    exact = [_exact_curve(c, num_samples, step) for c in curves]
+    errors = {}
+    for name, run in runs.items():
+        errors[name] = max(
+            max(abs(curve[t_i][0] - x), abs(curve[t_i][1] - y))
+            for curve, ref in zip(run(), exact)
+            for t_i, (x, y) in ref.items()
+        )
+    return rates, errors
+
+
+# Roda todos os tamanhos e devolve linhas (pontos, método, vazão, erro)
+def run_high_degree_benchmark(points=DEFAULT_POINTS, repeat=3, seed=0):
+    rows = []
+    for n_points in points:
+        rates, errors = bench_high_degree(n_points, repeat=repeat, seed=seed)
+        for name, rate in rates.items():
+            rows.append((n_points, name, rate, errors[name]))
+    return rows
+
+
+# Curvas (pontos de controle, modo) com os modos sorteados entre `modes`
+def make_curves(n_curves, modes, seed=0, extent=500.0):
+    rnd = random.Random(seed)
+    curves = []
+    for _ in range(n_curves):
+        mode = rnd.choice(modes)
+        coords = [
+            (rnd.uniform(-extent, extent), rnd.uniform(-extent, extent))
+            for _ in range(_BATCH_POINTS[mode])
+        ]
+        curves.append((coords, mode))
+    return curves
+
+
+def _tessellate_one(coords, mode, tolerance):
+    if tolerance is not None:
+        return flatten_curve(coords, mode, tolerance)
+    return _EVALUATORS[mode](coords, CURVE_SAMPLES[mode])
+
+
+# Mede curva a curva e em lote; devolve {método: amostras/s} e a maior
+# diferença entre as amostras dos dois
+def bench_batch(curves, tolerance=None, repeat=3):
+    runs = {
+        "curva": lambda: [_tessellate_one(c, m, tolerance) for c, m in curves],
+        "lote": lambda: tessellate_batch(curves, tolerance=tolerance),
+    }
+    single = runs["curva"]()
+    flat, offsets = runs["lote"]()
+    n = offsets[-1]
+    rates = {name: n / max(_timed(run, repeat), 1e-12) for name, run in runs.items()}
+    error = max(
+        (
+            max(abs(xa - xb), abs(ya - yb))
+            for i, points in enumerate(single)
+            for (xa, ya), (xb, yb) in zip(points, curve_points(flat, offsets, i))
+        ),
+        default=0.0,
+    )
+    return rates, error
+
+
+# Roda cada combinação de modos e tolerância; devolve linhas (carga, método,
+# vazão, erro), com a carga "G0", "G0+G1+BS@0.25" etc.
+def run_batch_benchmark(
+    n_curves=300, modes=DEFAULT_MODES, tolerances=DEFAULT_TOLERANCES, repeat=3, seed=0
+):
+    rows = []
+    for mode_set in modes:
+        curves = make_curves(n_curves, mode_set, seed)
+        for tolerance in tolerances:
+            label = "+".join(mode_set)
+            if tolerance is not None:
+                label += f"@{tolerance}"
+            rates, error = bench_batch(curves, tolerance, repeat)
+            for name, rate in rates.items():
+                rows.append((label, name, rate, error))
+    return rows
+
+
+def format_report(rows, first="amostras"):
+    lines = [f"{first:>8} {'método':>9} {'amostras/s':>12} {'erro máx':>10}"]
+    for size, name, rate, error in rows:
+        lines.append(f"{size:>8} {name:>9} {rate:12.0f} {error:10.2e}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(format_report(run_benchmark()))
+    print()
+    print(format_report(run_high_degree_benchmark(), first="pontos"))
+    print()
+    print("lote vetorizado (NumPy):", "sim" if VECTORIZED else "não")
+    print(format_report(run_batch_benchmark(), first="carga"))
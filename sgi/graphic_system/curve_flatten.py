@@ -0,0 +1,126 @@
+import math
+
+from .bezier_curve import bezier_curve
+
+# Tesselação adaptativa de curvas por planura (flatness).
+#
+# Em vez de um número fixo de amostras, cada trecho cúbico é subdividido ao
+# meio (De Casteljau) até que a curva fique a menos de `tolerance` (unidades
+# do mundo; o GraphicSystem converte a tolerância em pixels para o mundo) da
+# corda que liga suas pontas. Curvas pequenas ou distantes viram poucos
+# segmentos; curvas grandes na tela continuam suaves.
+#
+# Critério de planura: a diferença entre a Bézier e a corda é a Bézier de
+# pontos de controle P_i - L(i/n), com L a interpolação linear de P_0 a P_n;
+# pelo fecho convexo, a distância fica limitada pelo maior |P_i - L(i/n)|.
+
+# Limite de subdivisões de um trecho cúbico (2^16 segmentos no máximo)
+MAX_DEPTH = 16
+
+# Limites de segmentos para as Béziers de grau alto (potências de 2, para
+# reaproveitar as tabelas de Bernstein entre zooms)
+_MIN_SEGMENTS = 1
+_MAX_SEGMENTS = 1024
+
+
+# Acrescenta a `out` os pontos do trecho cúbico, exceto o primeiro.
+# tol2: (3 * tolerância)^2, já que 3 * (P_1 - L(1/3)) = 3 P_1 - 2 P_0 - P_3
+def _flatten_cubic(x0, y0, x1, y1, x2, y2, x3, y3, tol2, depth, out):
+    ax = 3 * x1 - 2 * x0 - x3
+    ay = 3 * y1 - 2 * y0 - y3
+    bx = 3 * x2 - x0 - 2 * x3
+    by = 3 * y2 - y0 - 2 * y3
+    if depth == 0 or max(ax * ax + ay * ay, bx * bx + by * by) <= tol2:
+        out.append((x3, y3))
+        return
+
+    # De Casteljau em t = 1/2
+    x01, y01 = (x0 + x1) / 2, (y0 + y1) / 2
+    x12, y12 = (x1 + x2) / 2, (y1 + y2) / 2
+    x23, y23 = (x2 + x3) / 2, (y2 + y3) / 2
+    xa, ya = (x01 + x12) / 2, (y01 + y12) / 2
+    xb, yb = (x12 + x23) / 2, (y12 + y23) / 2
+    xm, ym = (xa + xb) / 2, (ya + yb) / 2
+    _flatten_cubic(x0, y0, x01, y01, xa, ya, xm, ym, tol2, depth - 1, out)
+    _flatten_cubic(xm, ym, xb, yb, x23, y23, x3, y3, tol2, depth - 1, out)
+
+
+def flatten_cubic(p0, p1, p2, p3, tolerance, out=None):
+    out = [tuple(p0)] if out is None else out
+    tol2 = 9 * tolerance * tolerance
+    _flatten_cubic(*p0, *p1, *p2, *p3, tol2, MAX_DEPTH, out)
+    return out
+
+
+# Bézier de grau qualquer. Cúbicas são subdivididas; nas de grau alto cada
+# subdivisão custaria O(n^2), então o número de segmentos uniformes sai de
+# bezier_segments
+def flatten_bezier(points, tolerance):
+    n = len(points) - 1
+    if n < 1:
+        return [tuple(p) for p in points]
+    if n == 3:
+        return flatten_cubic(*points, tolerance)
+    return bezier_curve(points, bezier_segments(points, tolerance))
+
+
+# Segmentos uniformes (potência de 2) de uma Bézier de grau n >= 1, pela cota
+# n(n-1)/8 * max|Δ²P| / N^2 para a distância entre a curva e a polilinha das
+# N + 1 amostras
+def bezier_segments(points, tolerance):
+    n = len(points) - 1
+    d2 = max(
+        (
+            math.hypot(
+                points[i][0] - 2 * points[i + 1][0] + points[i + 2][0],
+                points[i][1] - 2 * points[i + 1][1] + points[i + 2][1],
+            )
+            for i in range(n - 1)
+        ),
+        default=0.0,
+    )
+    needed = math.sqrt(n * (n - 1) * d2 / (8 * tolerance))
+    segments = _MIN_SEGMENTS
+    while segments < needed and segments < _MAX_SEGMENTS:
+        segments *= 2
+    return segments
+
+
+# G0: trechos cúbicos encadeados (mesmos trechos de bezier_multisegment)
+def flatten_bezier_multisegment(points, tolerance):
+    if len(points) < 4:
+        return flatten_bezier(points, tolerance)
+
+    curve = [tuple(points[0])]
+    for i in range(0, len(points) - 3, 3):
+        flatten_cubic(*points[i : i + 4], tolerance, out=curve)
+    return curve
+
+
+# B-Spline cúbica uniforme: cada segmento vira a Bézier cúbica equivalente
+def flatten_bspline(points, tolerance):
+    if len(points) < 4:
+        return []
+
+    curve = []
+    for i in range(len(points) - 3):
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = points[i : i + 4]
+        b0 = ((x0 + 4 * x1 + x2) / 6, (y0 + 4 * y1 + y2) / 6)
+        b1 = ((2 * x1 + x2) / 3, (2 * y1 + y2) / 3)
+        b2 = ((x1 + 2 * x2) / 3, (y1 + 2 * y2) / 3)
+        b3 = ((x1 + 4 * x2 + x3) / 6, (y1 + 4 * y2 + y3) / 6)
+        if not curve:
+            curve.append(b0)
+        flatten_cubic(b0, b1, b2, b3, tolerance, out=curve)
+    return curve
+
+
+# Amostras de uma curva conforme o modo ("G0", "G1" ou "BS")
+def flatten_curve(points, mode, tolerance):
+    if mode == "G0":
+        return flatten_bezier_multisegment(points, tolerance)
+    elif mode == "G1":
+        return flatten_bezier(points, tolerance)
+    elif mode == "BS":
+        return flatten_bspline(points, tolerance)
+    return []
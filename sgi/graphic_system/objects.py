@@ -2,6 +2,7 @@ import math
 from typing import List, Tuple, Union
 
 from .point3d import Point3D
+from .spatial_index import SpatialIndex
 
 # Tipos de objeto
 POINT = "point"
@@ -34,12 +35,45 @@ class Object2D:
     ):
         self.name = name
         self.obj_type = obj_type
+        self.version = 0  # incrementado a cada mudança de geometria
+        self._display = None  # display file que indexa o objeto
+        self._bbox = None
+        self._bbox_version = -1
         self.coordinates = coordinates  # lista de tuples (x,y)
         self.color = color  # cor de contorno (RGBf hex)
         self.fill_color = fill_color  # cor de preenchimento (apenas para wireframes)
         self.filled = filled  # se o objeto é preenchido (apenas para wireframes)
         self.curve_mode = curve_mode  # modo da curva (apenas para curvas)
 
+    # Atribuir novas coordenadas (ex.: apply_transform) invalida os caches
+    @property
+    def coordinates(self) -> List[Tuple[float, float]]:
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, coords: List[Tuple[float, float]]):
+        self._coordinates = coords
+        self.touch()
+
+    # Marca a geometria como alterada (e reindexa no display file)
+    def touch(self):
+        self.version += 1
+        if self._display is not None:
+            self._display.reindex(self)
+
+    # Caixa envolvente (x_min, y_min, x_max, y_max) das coordenadas,
+    # recalculada só quando a geometria muda
+    def bbox(self):
+        if self._bbox_version != self.version:
+            self._bbox_version = self.version
+            if not self.coordinates:
+                self._bbox = None
+            else:
+                xs = [p[0] for p in self.coordinates]
+                ys = [p[1] for p in self.coordinates]
+                self._bbox = (min(xs), min(ys), max(xs), max(ys))
+        return self._bbox
+
     def centroid(self):
         if not self.coordinates:
             return 0.0, 0.0
@@ -59,6 +93,7 @@ class Object3D:
         self.edges = edges  # list of (Point3D, Point3D)
         self.color = color
         self.type = OBJECT3D
+        self.version = 0  # incrementado a cada transformação
 
     def __repr__(self):
         return f"Object3D({self.name}, edges={len(self.edges)})"
@@ -75,9 +110,14 @@ class Object3D:
                 uniq.append(b)
         return uniq
 
+    # Marca a geometria como alterada
+    def touch(self):
+        self.version += 1
+
     def translate(self, tx: float, ty: float, tz: float):
         for p in self._unique_points():
             p.translate(tx, ty, tz)
+        self.touch()
 
     def scale(
         self,
@@ -90,18 +130,22 @@ class Object3D:
     ):
         for p in self._unique_points():
             p.scale(sx, sy, sz, cx, cy, cz)
+        self.touch()
 
     def rotate_x(self, angle_deg: float):
         for p in self._unique_points():
             p.rotate_x(angle_deg)
+        self.touch()
 
     def rotate_y(self, angle_deg: float):
         for p in self._unique_points():
             p.rotate_y(angle_deg)
+        self.touch()
 
     def rotate_z(self, angle_deg: float):
         for p in self._unique_points():
             p.rotate_z(angle_deg)
+        self.touch()
 
     def rotate_axis(self, p1: Point3D, p2: Point3D, angle_deg: float):
         ux, uy, uz = (p2.x - p1.x, p2.y - p1.y, p2.z - p1.z)
@@ -140,6 +184,7 @@ class Object3D:
             yr = R[1][0] * x + R[1][1] * y + R[1][2] * z
             zr = R[2][0] * x + R[2][1] * y + R[2][2] * z
             point.x, point.y, point.z = xr + p1.x, yr + p1.y, zr + p1.z
+        self.touch()
 
     def rotate_about(self, reference, axis, angle_deg, center=None, direction=None):
         if axis in ("x", "y", "z"):
@@ -179,6 +224,7 @@ class Object3D:
             elif axis == "z":
                 x, y = x * c - y * s, x * s + y * c
             p.x, p.y, p.z = x + cx, y + cy, z + cz
+        self.touch()
 
     def centroid(self):
         pts = self._unique_points()
@@ -232,10 +278,18 @@ class Object3D:
             for j in range(4):
                 view_matrix[i][j] = sum(view_orient[i][k] * t[k][j] for k in range(4))
 
+        # planos near/far em coordenadas de câmera: arestas (ou partes delas)
+        # fora do volume de visão são descartadas antes da divisão perspectiva
+        z_near, z_far = camera.depth_range()
+
         projected_edges = []
         for p1, p2 in self.edges:
             p1v = self._apply_matrix(p1, view_matrix)
             p2v = self._apply_matrix(p2, view_matrix)
+            clipped = camera.clip_depth(p1v, p2v, z_near, z_far)
+            if clipped is None:
+                continue
+            p1v, p2v = clipped
             if camera.projection_mode == "perspective":
                 d = camera.d
                 p1v = (
@@ -294,6 +348,7 @@ class BezierPatch(Object3D):
         self.control = control_grid  # [[Point3D]*4]*4
         self.nu = int(nu)
         self.nv = int(nv)
+        self.lod = True  # LOD em tela (False: malha sempre nu x nv)
         self.type = SURFACE
 
     # Faz as operações 3D do Object3D agirem sobre os pontos de controle
@@ -311,6 +366,7 @@ class BezierSurface(Object3D):
     def __init__(self, name, patches, color="black"):
         super().__init__(name, edges=[], color=color)
         self.patches = patches  # List[BezierPatch]
+        self.lod = True  # LOD em tela (False: malhas sempre nu x nv)
         self.type = SURFACE
 
     def _unique_points(self):
@@ -333,6 +389,7 @@ class BSplineSurface(Object3D):
         self.control = control
         self.nu = int(max(1, nu))
         self.nv = int(max(1, nv))
+        self.lod = True  # LOD em tela (False: malha sempre nu x nv)
         self.type = SURFACE
 
     def _unique_points(self):
@@ -345,19 +402,65 @@ class BSplineSurface(Object3D):
         return pts
 
     # O core usa isso para desenhar (o GraphicSystem._draw_surface_object já trata)
-    def generate_mesh(self):
+    def generate_mesh(self, densities=None):
         # late import pra não dar loop circular
         from .bspline_surface import generate_bspline_mesh
 
-        return generate_bspline_mesh(self.control, self.nu, self.nv)
+        return generate_bspline_mesh(self.control, self.nu, self.nv, densities)
 
 
 class DisplayFile:
-    def __init__(self):
+    def __init__(self, cell_size: float = 50.0):
         self.objects: List[Union[Object2D, Object3D]] = []
+        self.version = 0  # incrementado quando objetos entram/saem
+        # índice espacial dos objetos 2D (caixas envolventes no mundo)
+        self.index = SpatialIndex(cell_size)
+        self._order = {}  # objeto -> ordem de inserção (ordem de desenho)
+        self._count = 0
+        self._objects3d: List[Object3D] = []
+
+    def __contains__(self, obj):
+        return obj in self._order
 
     def add(self, obj: Union[Object2D, Object3D]):
         self.objects.append(obj)
+        self.version += 1
+        self._count += 1
+        self._order[obj] = self._count
+        if isinstance(obj, Object2D):
+            obj._display = self
+            self.index.insert(obj, obj.bbox())
+        else:
+            self._objects3d.append(obj)
 
     def remove(self, obj: Union[Object2D, Object3D]):
         self.objects.remove(obj)
+        self.version += 1
+        del self._order[obj]
+        if isinstance(obj, Object2D):
+            obj._display = None
+            self.index.remove(obj)
+        else:
+            self._objects3d.remove(obj)
+
+    def clear(self):
+        for obj in self.objects:
+            if isinstance(obj, Object2D):
+                obj._display = None
+        self.objects.clear()
+        self.version += 1
+        self.index.clear()
+        self._order.clear()
+        self._objects3d.clear()
+
+    # Chamado pelo Object2D quando sua geometria muda
+    def reindex(self, obj: Object2D):
+        if obj in self._order:
+            self.index.update(obj, obj.bbox())
+
+    # Objetos candidatos a aparecer numa região do mundo, na ordem de desenho:
+    # os 2D vêm do índice espacial; os 3D dependem da câmera e entram sempre
+    def visible(self, bbox) -> List[Union[Object2D, Object3D]]:
+        found = self.index.query(bbox) + self._objects3d
+        found.sort(key=self._order.__getitem__)
+        return found
@@ -0,0 +1,144 @@
+from typing import Dict, Hashable, List, Sequence, Tuple
+
+# Primitiva de desenho: (tipo, coords, opções)
+#   tipo   -> "line" | "oval" | "polygon" | "rectangle"
+#   coords -> sequência plana (x1, y1, x2, y2, ...) em pixels
+#   opções -> dict de opções do Tk (fill, outline, dash, width...)
+Primitive = Tuple[str, Sequence[float], dict]
+
+
+# Renderer "retido": guarda para cada chave (objeto do display file, moldura,
+# prévia...) os itens do canvas que a representam e os reaproveita entre
+# quadros via canvas.coords/itemconfig. Só cria itens quando a topologia muda
+# (quantidade/tipo de primitivas) e só apaga os que deixaram de existir.
+class RetainedRenderer:
+    def __init__(self, canvas):
+        self.canvas = canvas
+        # chave -> lista de [item_id, tipo, opções]
+        self._items: Dict[Hashable, List[list]] = {}
+        # chave -> tag exclusiva (usada para reempilhar os itens da chave)
+        self._tags: Dict[Hashable, str] = {}
+        self._tag_count = 0
+
+        # estado do quadro corrente
+        self._seen = set()
+        self._order: List[Hashable] = []
+        self._created = set()  # chaves com itens criados neste quadro
+        self._fresh = set()  # chaves com todos os itens criados neste quadro
+
+    def begin_frame(self):
+        self._seen = set()
+        self._order = []
+        self._created = set()
+        self._fresh = set()
+
+    # Sincroniza os itens da chave com a lista de primitivas do quadro.
+    # group: tag compartilhada (ex.: "world") para mover vários itens de uma vez
+    def draw(self, key: Hashable, primitives: List[Primitive], group=None):
+        self._seen.add(key)
+        self._order.append(key)
+
+        items = self._items.get(key)
+        if items is None:
+            items = []
+            self._items[key] = items
+
+        # topologia mudou (tipos/opções diferentes): recria tudo da chave para
+        # manter a ordem de empilhamento das primitivas
+        n_common = min(len(items), len(primitives))
+        for i in range(n_common):
+            kind, _coords, opts = primitives[i]
+            if items[i][1] != kind or items[i][2].keys() != opts.keys():
+                self._delete_items(items)
+                items.clear()
+                break
+
+        if not items and primitives:
+            self._fresh.add(key)
+        canvas = self.canvas
+        for i, (kind, coords, opts) in enumerate(primitives):
+            if i < len(items):
+                entry = items[i]
+                canvas.coords(entry[0], *coords)
+                if entry[2] != opts:
+                    canvas.itemconfig(entry[0], **opts)
+                    entry[2] = opts
+            else:
+                item_id = self._create(key, kind, coords, opts, group)
+                items.append([item_id, kind, opts])
+                self._created.add(key)
+
+        # primitivas que sumiram
+        if len(items) > len(primitives):
+            self._delete_items(items[len(primitives) :])
+            del items[len(primitives) :]
+
+    # Marca a chave como presente no quadro sem tocar nos seus itens
+    def keep(self, key: Hashable):
+        if key in self._items:
+            self._seen.add(key)
+            self._order.append(key)
+
+    # Translada em pixels todos os itens de um grupo com um único canvas.move
+    def move(self, group: str, dx: float, dy: float):
+        self.canvas.move(group, dx, dy)
+
+    # Põe todos os itens de um grupo no topo da pilha (mantendo a ordem entre eles)
+    def raise_group(self, group: str):
+        self.canvas.tag_raise(group)
+
+    def end_frame(self):
+        # apaga itens de chaves que não foram desenhadas neste quadro
+        for key in [k for k in self._items if k not in self._seen]:
+            self._delete_items(self._items.pop(key))
+            self._tags.pop(key, None)
+
+        # itens recém-criados vão para o topo da pilha do Tk; se alguma chave
+        # criada vier antes de outra com itens antigos, reempilha na ordem do
+        # quadro
+        if self._needs_restack():
+            self._restack()
+
+    def _needs_restack(self):
+        created_before = False
+        for key in self._order:
+            if created_before and self._items.get(key) and key not in self._fresh:
+                return True
+            if key in self._created:
+                created_before = True
+        return False
+
+    # Só as chaves criadas mudam de lugar (as demais já estão na ordem): cada
+    # uma vai logo acima da anterior do quadro; as que abrem o quadro, antes
+    # de qualquer chave existente, vão logo abaixo da seguinte
+    def _restack(self):
+        tags = [self._tags[k] for k in self._order if self._items.get(k)]
+        created = [k in self._created for k in self._order if self._items.get(k)]
+        lead = 0
+        while lead < len(tags) and created[lead]:
+            lead += 1
+        if lead < len(tags):
+            for i in range(lead - 1, -1, -1):
+                self.canvas.tag_lower(tags[i], tags[i + 1])
+        else:
+            lead = 1  # todas criadas: a primeira serve de referência
+        for i in range(lead, len(tags)):
+            if created[i]:
+                self.canvas.tag_raise(tags[i], tags[i - 1])
+
+    def _tag_for(self, key):
+        tag = self._tags.get(key)
+        if tag is None:
+            self._tag_count += 1
+            tag = f"sgi_item_{self._tag_count}"
+            self._tags[key] = tag
+        return tag
+
+    def _create(self, key, kind, coords, opts, group):
+        tags = (self._tag_for(key),) if group is None else (self._tag_for(key), group)
+        create = getattr(self.canvas, f"create_{kind}")
+        return create(*coords, tags=tags, **opts)
+
+    def _delete_items(self, items):
+        if items:
+            self.canvas.delete(*[entry[0] for entry in items])
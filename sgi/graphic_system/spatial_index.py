@@ -0,0 +1,92 @@
+import math
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+BBox = Tuple[float, float, float, float]  # (x_min, y_min, x_max, y_max)
+
+
+# Grade uniforme esparsa (hash de células) de caixas envolventes 2D.
+# Cada objeto é registrado em todas as células que sua caixa toca; objetos
+# enormes (mais de max_cells células) ficam numa lista à parte e sempre
+# entram no resultado da consulta.
+class SpatialIndex:
+    def __init__(self, cell_size: float = 50.0, max_cells: int = 256):
+        self.cell_size = float(cell_size)
+        self.max_cells = max_cells
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._entries: Dict[Hashable, Tuple[BBox, list]] = {}
+        self._large: Set[Hashable] = set()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _cell_range(self, bbox: BBox):
+        s = self.cell_size
+        return (
+            math.floor(bbox[0] / s),
+            math.floor(bbox[1] / s),
+            math.floor(bbox[2] / s),
+            math.floor(bbox[3] / s),
+        )
+
+    def insert(self, obj: Hashable, bbox: Optional[BBox]):
+        if obj in self._entries:
+            self.remove(obj)
+        if bbox is None:
+            self._entries[obj] = (None, [])  # sem geometria: nunca é visível
+            return
+
+        i0, j0, i1, j1 = self._cell_range(bbox)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > self.max_cells:
+            self._entries[obj] = (bbox, [])
+            self._large.add(obj)
+            return
+
+        keys = [(i, j) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1)]
+        for k in keys:
+            self._cells.setdefault(k, set()).add(obj)
+        self._entries[obj] = (bbox, keys)
+
+    def remove(self, obj: Hashable):
+        entry = self._entries.pop(obj, None)
+        if entry is None:
+            return
+        self._large.discard(obj)
+        for k in entry[1]:
+            cell = self._cells[k]
+            cell.discard(obj)
+            if not cell:
+                del self._cells[k]
+
+    # Reindexa um objeto cuja geometria mudou
+    def update(self, obj: Hashable, bbox: Optional[BBox]):
+        self.insert(obj, bbox)
+
+    def clear(self):
+        self._cells.clear()
+        self._entries.clear()
+        self._large.clear()
+
+    # Objetos cuja caixa intersecta a caixa consultada
+    def query(self, bbox: BBox) -> List[Hashable]:
+        qx0, qy0, qx1, qy1 = bbox
+        i0, j0, i1, j1 = self._cell_range(bbox)
+
+        candidates: Set[Hashable] = set(self._large)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self._cells):
+            # consulta maior que a própria grade: percorre as células ocupadas
+            for (i, j), cell in self._cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    candidates |= cell
+        else:
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    cell = self._cells.get((i, j))
+                    if cell:
+                        candidates |= cell
+
+        out = []
+        for obj in candidates:
+            bx0, by0, bx1, by1 = self._entries[obj][0]
+            if bx0 <= qx1 and bx1 >= qx0 and by0 <= qy1 and by1 >= qy0:
+                out.append(obj)
+        return out
@@ -0,0 +1,88 @@
+from .bezier_surface import generate_surface_grid
+from .bspline_surface import generate_bspline_patch_grid, subdivide_patches
+
+# Cache das malhas 3D (mundo) das superfícies.
+#
+# A malha de uma superfície só depende dos pontos de controle e das
+# densidades (nu, nv): mudanças de câmera, zoom ou pan apenas reprojetam.
+# Cada retalho guarda as grades das últimas MAX_DENSITIES densidades usadas,
+# então uma troca de densidade (nu/nv editados, LOD mudando de nível, modo
+# interativo e volta à qualidade total) só regera os retalhos afetados, e só
+# na primeira vez. Tudo é descartado quando a versão da geometria muda, i.e.
+# quando translate/scale/rotate_* mexem nos pontos de controle.
+
+MAX_DENSITIES = 4
+
+
+# Controles 4x4 de cada retalho (na ordem das malhas) e a função que gera a
+# grade de um retalho
+def surface_patches(surface):
+    if hasattr(surface, "generate_mesh"):
+        return subdivide_patches(surface.control), generate_bspline_patch_grid
+    patches = getattr(surface, "patches", None) or [surface]
+    return [p.control for p in patches], generate_surface_grid
+
+
+# Versão da geometria: a da superfície mais a de cada retalho Bézier (um
+# retalho também pode ser transformado sozinho)
+def surface_version(surface):
+    patches = getattr(surface, "patches", None)
+    if patches:
+        return (surface.version,) + tuple(p.version for p in patches)
+    return (surface.version,)
+
+
+# Densidades (nu, nv) definidas nos próprios objetos
+def fixed_densities(surface, n_patches):
+    if hasattr(surface, "generate_mesh"):
+        return [(surface.nu, surface.nv)] * n_patches
+    patches = getattr(surface, "patches", None) or [surface]
+    return [(p.nu, p.nv) for p in patches]
+
+
+class SurfaceMeshCache:
+    def __init__(self):
+        # superfície -> (versão, controles, gerador, [{(nu, nv): grade} por retalho])
+        self._surfaces = {}
+        self.generated = 0  # grades de retalho geradas
+        self.reused = 0  # grades de retalho reaproveitadas
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    # Uma grade por retalho; densities: (nu, nv) de cada retalho (ex.: do
+    # LOD), ou None para as densidades fixas dos objetos
+    def grids(self, surface, densities=None):
+        version = surface_version(surface)
+        entry = self._surfaces.get(surface)
+        if entry is None or entry[0] != version:
+            patches, generate = surface_patches(surface)
+            entry = (version, patches, generate, [{} for _ in patches])
+            self._surfaces[surface] = entry
+        _version, patches, generate, cached = entry
+        if densities is None:
+            densities = fixed_densities(surface, len(patches))
+
+        out = []
+        for control, grids, density in zip(patches, cached, densities):
+            grid = grids.pop(density, None)
+            if grid is None:
+                grid = generate(control, *density)
+                self.generated += 1
+                if len(grids) >= MAX_DENSITIES:
+                    del grids[next(iter(grids))]
+            else:
+                self.reused += 1
+            # reinsere no fim: a ordem do dict é a do uso mais recente
+            grids[density] = grid
+            out.append(grid)
+        return out
+
+    # Descarta as superfícies que satisfazem o predicado (ex.: removidas do
+    # display file)
+    def discard(self, predicate):
+        for surface in [s for s in self._surfaces if predicate(s)]:
+            del self._surfaces[surface]
+
+    def clear(self):
+        self._surfaces.clear()
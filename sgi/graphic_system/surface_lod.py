@@ -0,0 +1,113 @@
+import math
+
+# Nível de detalhe (LOD) das malhas de superfície em espaço de tela.
+#
+# O tamanho de cada retalho na tela é estimado pelo seu polígono de controle
+# projetado: uma isoparamétrica nunca é mais longa que a poligonal dos
+# controles correspondentes. A densidade em cada direção é escolhida para que
+# cada segmento da malha tenha cerca de LOD_PIXELS pixels, arredondada para
+# cima a uma potência de 2 (zoom e câmera só refazem a malha quando o tamanho
+# cruza um fator 2) e limitada a [LOD_MIN, LOD_MAX]. Retalhos cujos
+# controles projetados ficam fora da window recebem LOD_MIN. Nos retalhos
+# visíveis as divisões nu x nv definidas na superfície são o piso: o LOD só
+# refina a malha (até LOD_MAX, ou mantém nu x nv se forem maiores).
+
+LOD_PIXELS = 8.0
+LOD_MIN = 2
+LOD_MAX = 64
+
+
+# Grade de controle projetada no mundo 2D; None nos pontos fora da faixa de
+# profundidade visível
+def project_control(control, camera):
+    z_near, z_far = camera.depth_range()
+    grid = []
+    for row in control:
+        out = []
+        for p in row:
+            xc, yc, zc = camera.world_to_camera((p.x, p.y, p.z))
+            if z_near <= zc <= z_far:
+                out.append(camera.project_camera_point(xc, yc, zc))
+            else:
+                out.append(None)
+        grid.append(out)
+    return grid
+
+
+# Comprimento da poligonal de controle de uma isoparamétrica (4 pontos). Na
+# B-Spline o segmento só cobre o vão do meio: mede a poligonal da Bézier
+# equivalente, que é a que limita o comprimento da curva
+def _control_length(line, bspline):
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = line
+    if bspline:
+        line = [
+            ((x0 + 4 * x1 + x2) / 6, (y0 + 4 * y1 + y2) / 6),
+            ((2 * x1 + x2) / 3, (2 * y1 + y2) / 3),
+            ((x1 + 2 * x2) / 3, (y1 + 2 * y2) / 3),
+            ((x1 + 4 * x2 + x3) / 6, (y1 + 4 * y2 + y3) / 6),
+        ]
+    return sum(math.dist(line[k], line[k + 1]) for k in range(3))
+
+
+# (comprimento u, comprimento v, caixa) do retalho 4x4 que começa em
+# (i0, j0): a maior poligonal de controle na direção u (índice i) e na
+# direção v (índice j), mais a caixa envolvente (mundo 2D) dos controles
+# projetados. Retalho atravessando o near/far fica com densidade máxima;
+# todo fora, mínima.
+def patch_lengths(grid, i0=0, j0=0, bspline=False):
+    pts = [row[j0 : j0 + 4] for row in grid[i0 : i0 + 4]]
+    missing = sum(p is None for row in pts for p in row)
+    if missing == 16:
+        return 0.0, 0.0, None
+    if missing:
+        return math.inf, math.inf, None
+    length_u = max(_control_length([row[j] for row in pts], bspline) for j in range(4))
+    length_v = max(_control_length(row, bspline) for row in pts)
+    xs = [p[0] for row in pts for p in row]
+    ys = [p[1] for row in pts for p in row]
+    return length_u, length_v, (min(xs), min(ys), max(xs), max(ys))
+
+
+# (comprimento u, comprimento v, caixa) de cada retalho, na ordem em que as malhas
+# são geradas (subdivide_patches na B-Spline, patches na Bézier)
+def surface_patch_lengths(surface, camera):
+    if hasattr(surface, "generate_mesh"):
+        # B-Spline: os retalhos compartilham a malha m x n, projetada uma vez
+        grid = project_control(surface.control, camera)
+        return [
+            patch_lengths(grid, i, j, bspline=True)
+            for i in range(len(grid) - 3)
+            for j in range(len(grid[0]) - 3)
+        ]
+    patches = getattr(surface, "patches", None) or [surface]
+    return [patch_lengths(project_control(p.control, camera)) for p in patches]
+
+
+# Divisões para uma isoparamétrica de `length` (mundo) na escala corrente
+def lod_density(length, world_per_pixel, pixels=LOD_PIXELS):
+    needed = length / (world_per_pixel * pixels)
+    density = LOD_MIN
+    while density < needed and density < LOD_MAX:
+        density *= 2
+    return density
+
+
+# (nu, nv) de cada retalho a partir de surface_patch_lengths; view: caixa
+# (mundo 2D) visível; floors: (nu, nv) mínimos de cada retalho visível
+# (None = só LOD_MIN)
+def patch_densities(lengths, world_per_pixel, view, pixels=LOD_PIXELS, floors=None):
+    x0, y0, x1, y1 = view
+    out = []
+    for k, (length_u, length_v, bbox) in enumerate(lengths):
+        if bbox is not None and (
+            bbox[0] > x1 or bbox[2] < x0 or bbox[1] > y1 or bbox[3] < y0
+        ):
+            nu, nv = LOD_MIN, LOD_MIN
+        else:
+            nu = lod_density(length_u, world_per_pixel, pixels)
+            nv = lod_density(length_v, world_per_pixel, pixels)
+            if floors is not None:
+                nu = max(nu, floors[k][0])
+                nv = max(nv, floors[k][1])
+        out.append((nu, nv))
+    return tuple(out)
@@ -0,0 +1,97 @@
+import sys
+from array import array
+from collections import OrderedDict
+from itertools import chain
+
+
+# Cache LRU limitado das amostras (mundo) de curvas.
+#
+# Chave: (objeto, versão da geometria, modo da curva, densidade), com a
+# densidade sendo a tolerância do achatamento (ou None para as amostras fixas).
+# Valor: array('d') plano (x0, y0, x1, y1, ...). Guardar várias densidades
+# por objeto faz zoom de ida e volta e a troca entre o modo interativo e a
+# qualidade total reaproveitarem as tesselações já feitas. As entradas menos
+# usadas recentemente são descartadas quando o total passa de max_bytes.
+#
+# Entradas guardadas com prefetch=True (tesseladas em lote antes do desenho)
+# contam como falha no primeiro get, já que a tesselação foi feita para ele.
+class TessellationCache:
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # chave -> (array, bytes)
+        self._prefetched = set()  # chaves ainda não lidas desde o prefetch
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    # Consulta sem afetar estatísticas nem a ordem LRU
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        if key in self._prefetched:
+            self._prefetched.discard(key)
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry[0]
+
+    def put(self, key, samples, prefetch=False):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self._prefetched.discard(key)
+        size = sys.getsizeof(samples)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (samples, size)
+        self.bytes += size
+        if prefetch:
+            self._prefetched.add(key)
+        while self.bytes > self.max_bytes:
+            old_key, (_samples, old_size) = self._entries.popitem(last=False)
+            self._prefetched.discard(old_key)
+            self.bytes -= old_size
+            self.evictions += 1
+
+    # Descarta as entradas cujas chaves satisfazem o predicado (ex.: objetos
+    # que saíram do display file)
+    def discard(self, predicate):
+        for key in [k for k in self._entries if predicate(k)]:
+            self.bytes -= self._entries.pop(key)[1]
+            self._prefetched.discard(key)
+
+    def clear(self):
+        self._entries.clear()
+        self._prefetched.clear()
+        self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# Pontos (x, y) <-> array plano guardado no cache
+def pack_points(points):
+    return array("d", chain.from_iterable(points))
+
+
+def unpack_points(samples):
+    return list(zip(samples[0::2], samples[1::2]))
@@ -1,6 +1,10 @@
 import math
 from typing import Tuple
 
+# Em perspectiva, o plano near efetivo fica no mínimo a esta fração de d à
+# frente do centro de projeção (evita divisões por ~0 e pontos atrás da câmera)
+MIN_DEPTH_RATIO = 0.01
+
 
 class Window3D:
     def __init__(
@@ -29,6 +33,7 @@ class Window3D:
 
         self.projection_mode = "perspective"  # ou "parallel"
         self.d = 500.0  # distância do plano de projeção ao VRP
+        self.version = 0  # incrementado a cada mudança de câmera
 
     @staticmethod
     def _normalize(vec):
@@ -99,15 +104,18 @@ class Window3D:
             self.vup = rotate_vec(self.vup, n_axis, roll_deg)
 
         self._recompute_uvn()
+        self.version += 1
 
     def toggle_projection(self):
         if self.projection_mode == "parallel":
             self.projection_mode = "perspective"
         else:
             self.projection_mode = "parallel"
+        self.version += 1
 
     def change_d(self, delta: float):
         self.d = max(10.0, self.d + delta)
+        self.version += 1
 
     # Converte ponto do mundo para camera
     def world_to_camera(self, p: Tuple[float, float, float]):
@@ -137,3 +145,66 @@ class Window3D:
             else:
                 out.append(self.project_point(P))
         return out
+
+    # Faixa de profundidade (zc) visível: planos near/far em coordenadas de
+    # câmera; em perspectiva o near nunca passa do centro de projeção (zc = -d)
+    def depth_range(self):
+        if self.projection_mode == "perspective":
+            return max(self.near, -self.d * (1.0 - MIN_DEPTH_RATIO)), self.far
+        return self.near, self.far
+
+    # Projeta um ponto já em coordenadas de câmera (sem clipping)
+    def project_camera_point(self, xc: float, yc: float, zc: float):
+        if self.projection_mode == "parallel":
+            return (xc, yc)
+        denom = self.d + zc
+        return (self.d * xc / denom, self.d * yc / denom)
+
+    # Recorta um segmento em coordenadas de câmera contra os planos near/far.
+    # Devolve (p1, p2) recortados (os originais, se intactos) ou None
+    @staticmethod
+    def clip_depth(p1, p2, z_near: float, z_far: float):
+        z1, z2 = p1[2], p2[2]
+        if (z1 < z_near and z2 < z_near) or (z1 > z_far and z2 > z_far):
+            return None
+        if z_near <= z1 <= z_far and z_near <= z2 <= z_far:
+            return p1, p2
+
+        dz = z2 - z1
+        t0, t1 = 0.0, 1.0
+        if z1 < z_near:
+            t0 = (z_near - z1) / dz
+        elif z2 < z_near:
+            t1 = (z_near - z1) / dz
+        if z1 > z_far:
+            t0 = max(t0, (z_far - z1) / dz)
+        elif z2 > z_far:
+            t1 = min(t1, (z_far - z1) / dz)
+        if t0 > t1:
+            return None
+
+        def lerp(t):
+            return tuple(a + t * (b - a) for a, b in zip(p1, p2))
+
+        return (p1 if t0 == 0.0 else lerp(t0)), (p2 if t1 == 1.0 else lerp(t1))
+
+    # Polilinha em coordenadas de câmera -> trechos 2D projetados, recortados
+    # antes da divisão perspectiva
+    def project_camera_polyline(self, points):
+        z_near, z_far = self.depth_range()
+        project = self.project_camera_point
+        runs = []
+        run = None
+        for a, b in zip(points, points[1:]):
+            clipped = self.clip_depth(a, b, z_near, z_far)
+            if clipped is None:
+                run = None
+                continue
+            c1, c2 = clipped
+            if run is None or c1 is not a:
+                run = [project(*c1)]
+                runs.append(run)
+            run.append(project(*c2))
+            if c2 is not b:
+                run = None
+        return runs
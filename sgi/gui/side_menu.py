@@ -959,6 +959,29 @@ def create_clipping_controls(menu_frame, system):
         command=lambda: system.set_clipping_mode(system.clip_var.get()),
     ).pack(anchor="w")
 
+    tk.Radiobutton(
+        clipping_frame,
+        text="Nicholl-Lee-Nicholl",
+        variable=system.clip_var,
+        value="NLN",
+        command=lambda: system.set_clipping_mode(system.clip_var.get()),
+    ).pack(anchor="w")
+
+    tk.Radiobutton(
+        clipping_frame,
+        text="Automático",
+        variable=system.clip_var,
+        value="AUTO",
+        command=lambda: system.set_clipping_mode(system.clip_var.get()),
+    ).pack(anchor="w")
+
+    tk.Checkbutton(
+        clipping_frame,
+        text="Guard-band (64 px)",
+        variable=system.guard_band_var,
+        command=lambda: system.set_guard_band(64 if system.guard_band_var.get() else 0),
+    ).pack(anchor="w")
+
 
 # código gerado por GPT,
 # prompt: baseado no código importado, preciso implementar uma tela de entrada de dados onde você pode entrar com conjuntos de pontos de controle,
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# os testes importam graphic_system a partir da raiz do projeto (sgi/)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
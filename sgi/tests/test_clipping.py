@@ -0,0 +1,85 @@
+import math
+import random
+
+from graphic_system.clipping import (
+    ConvexRegion,
+    _signed_area,
+    clip_convex_polygon,
+    is_simple_polygon,
+    weiler_atherton,
+)
+
+SQUARE = [(-100, -100), (100, -100), (100, 100), (-100, 100)]
+
+
+def area(polygons):
+    return sum(abs(_signed_area(p)) for p in polygons)
+
+
+# Triângulo fora da região que só encosta na borda superior por um vértice
+def test_outside_polygon_touching_border_at_vertex():
+    region = ConvexRegion(SQUARE)
+    triangle = [(0, 100), (20, 150), (-20, 150)]
+    assert weiler_atherton(triangle, region) == []
+    assert weiler_atherton(triangle[::-1], region) == []
+    assert weiler_atherton(triangle[1:] + triangle[:1], region) == []
+
+
+# Triângulo dentro da região com um vértice sobre a borda: fica inteiro
+def test_inside_polygon_touching_border_at_vertex():
+    region = ConvexRegion(SQUARE)
+    triangle = [(0, 100), (-20, 50), (20, 50)]
+    assert area(weiler_atherton(triangle, region)) == abs(_signed_area(triangle))
+
+
+# Losango que entra e sai da região pelos vértices sobre a borda direita
+def test_polygon_entering_and_leaving_through_vertices():
+    region = ConvexRegion(SQUARE)
+    diamond = [(100, -50), (150, 0), (100, 50), (50, 0)]
+    assert area(weiler_atherton(diamond, region)) == 2500
+
+
+# Região inteira dentro do sujeito
+def test_region_inside_polygon():
+    region = ConvexRegion(SQUARE)
+    big = [(-200, -200), (200, -200), (200, 200), (-200, 200)]
+    assert area(weiler_atherton(big, region)) == 40000
+
+
+# Polígono côncavo que sai e volta: duas partes separadas, sem ponte na borda
+def test_concave_polygon_splits_in_parts():
+    region = ConvexRegion(SQUARE)
+    u_shape = [(-50, 0), (-30, 0), (-30, 150), (30, 150), (30, 0), (50, 0)]
+    u_shape += [(50, 200), (-50, 200)]
+    parts = weiler_atherton(u_shape, region)
+    assert len(parts) == 2
+    assert area(parts) == 2 * 20 * 100
+
+
+# Áreas iguais às do recorte convexo (Sutherland-Hodgman) em polígonos
+# estrelados aleatórios, com vértices forçados sobre a borda
+def test_area_matches_convex_clip():
+    region = ConvexRegion(SQUARE)
+    rnd = random.Random(1)
+    tested = 0
+    for _ in range(3000):
+        n = rnd.randint(3, 8)
+        cx, cy = rnd.randint(-150, 150), rnd.randint(-150, 150)
+        pts = []
+        for k in sorted(rnd.uniform(0, 2 * math.pi) for _ in range(n)):
+            r = rnd.randint(10, 120)
+            pts.append((cx + round(r * math.cos(k)), cy + round(r * math.sin(k))))
+        if rnd.random() < 0.5:
+            i = rnd.randrange(n)
+            x, y = pts[i]
+            if rnd.random() < 0.5:
+                pts[i] = (rnd.choice([-100, 100]), y)
+            else:
+                pts[i] = (x, rnd.choice([-100, 100]))
+        if len(set(pts)) < n or not is_simple_polygon(pts) or not _signed_area(pts):
+            continue
+        tested += 1
+        expected = area([clip_convex_polygon(pts, region) or []])
+        got = area(weiler_atherton(pts, region))
+        assert math.isclose(got, expected, rel_tol=1e-6, abs_tol=1e-6), pts
+    assert tested > 1000